@@ -0,0 +1,84 @@
+"""Gazetteer extraction cost as the vocabulary grows.
+
+Compares the token-trie gazetteer with a naive scan that checks every
+phrase as a substring of the input, for synthetic vocabularies of 100 to
+100k phrases:
+
+    python benchmarks/gazetteer_scaling.py --sizes=100,1000,10000,100000
+"""
+
+from absl import app
+from absl import flags
+import os
+import random
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from student360_agent.tools.gazetteer import Gazetteer, fold_text, skill_gazetteer  # noqa: E402
+
+FLAGS = flags.FLAGS
+flags.DEFINE_list("sizes", ["100", "1000", "10000", "100000"], "Vocabulary sizes to measure.")
+flags.DEFINE_integer("queries", 200, "User messages to extract from per size.")
+flags.DEFINE_integer("seed", 0, "Random seed for the synthetic vocabulary.")
+
+SAMPLE_MESSAGES = [
+    "Mình là sinh viên năm 3 ở Hà Nội, tìm việc thực tập Java Spring Boot",
+    "Looking for a part time ReactJS / NodeJS job in HCM, 6 months experience",
+    "Senior DevOps engineer Đà Nẵng: AWS, Kubernetes, Terraform, CI/CD",
+    "fresher data analyst biết SQL, Power BI, python pandas ở Cần Thơ",
+]
+
+
+def synthetic_phrase(rng: random.Random) -> str:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = rng.randint(1, 3)
+    return " ".join("".join(rng.choice(letters) for _ in range(rng.randint(4, 9)))
+                    for _ in range(words))
+
+
+def build_vocabulary(size: int, rng: random.Random) -> list[str]:
+    """Real skill phrases padded with synthetic ones up to ``size``"""
+    phrases = skill_gazetteer().values(" ".join(SAMPLE_MESSAGES))
+    while len(phrases) < size:
+        phrases.append(synthetic_phrase(rng))
+    return phrases[:size]
+
+
+def naive_values(phrases: list[str], text: str) -> list[str]:
+    folded = f" {' '.join(fold_text(text).split())} "
+    return [phrase for phrase in phrases if f" {phrase} " in folded]
+
+
+def time_per_query(fn, messages: list[str]) -> float:
+    started = time.perf_counter()
+    for message in messages:
+        fn(message)
+    return (time.perf_counter() - started) / len(messages) * 1e6
+
+
+def main(argv: list[str]) -> None:
+    del argv  # unused
+
+    rng = random.Random(FLAGS.seed)
+    messages = [SAMPLE_MESSAGES[i % len(SAMPLE_MESSAGES)] for i in range(FLAGS.queries)]
+    print(f"{'PHRASES':>8} {'BUILD':>10} {'TRIE':>12} {'NAIVE':>12}")
+    for size in [int(size) for size in FLAGS.sizes]:
+        phrases = [fold_text(phrase) for phrase in build_vocabulary(size, rng)]
+
+        started = time.perf_counter()
+        gazetteer = Gazetteer()
+        for phrase in phrases:
+            gazetteer.add(phrase, phrase)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        trie_us = time_per_query(gazetteer.values, messages)
+        naive_us = time_per_query(lambda text: naive_values(phrases, text), messages)
+        print(f"{size:>8} {build_ms:>8.1f}ms {trie_us:>10.1f}us {naive_us:>10.1f}us")
+
+
+if __name__ == "__main__":
+    app.run(main)
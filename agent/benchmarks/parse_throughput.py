@@ -0,0 +1,91 @@
+"""Listing-page parse throughput: single thread vs thread pool vs process pool.
+
+Parses the listing pages in --fixtures_dir (``*.html``; by default the
+anonymised TopCV-layout pages in benchmarks/fixtures, where more recorded
+pages can be dropped) or, with an empty --fixtures_dir, synthetic pages:
+
+    python benchmarks/parse_throughput.py
+    python benchmarks/parse_throughput.py --fixtures_dir= --cards=50
+"""
+
+from absl import app
+from absl import flags
+from concurrent.futures import ThreadPoolExecutor
+import glob
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from student360_agent.tools.parsing import available_cores, parse_listing, parse_pool  # noqa: E402
+
+FLAGS = flags.FLAGS
+flags.DEFINE_string("fixtures_dir", os.path.join(current_dir, "fixtures"),
+                    "Directory of recorded listing pages (*.html).")
+flags.DEFINE_integer("pages", 40, "Pages to parse per mode.")
+flags.DEFINE_integer("cards", 50, "Job cards per synthetic page.")
+
+
+def synthetic_listing_page(cards: int, page: int) -> bytes:
+    """Build a listing page with the size and shape of a real TopCV page"""
+    script = "<script>" + "var config = {a: 1, b: [1, 2, 3]};" * 2000 + "</script>"
+    nav = "<nav>" + "".join(f'<a href="/cat/{i}">Category {i}</a>' for i in range(300)) + "</nav>"
+    items = "".join(
+        f'<div class="job-item" data-cy="job-card">'
+        f'<h3 class="title"><a href="/viec-lam/job-{page}-{i}">Java Developer {i}</a></h3>'
+        f'<a class="company">Company {i}</a><label class="address">Hà Nội</label>'
+        f'<label class="salary">{10 + i % 20} - {20 + i % 20} triệu</label>'
+        f'<div class="tags">' + "<span>Java</span><span>Spring</span>" * 5 + "</div></div>"
+        for i in range(cards)
+    )
+    return (f"<html><head>{script}</head><body><header>{nav}</header>"
+            f'<div class="job-list-search-result">{items}</div>'
+            f"<footer>{nav}</footer>{script}</body></html>").encode()
+
+
+def load_pages() -> list[bytes]:
+    if FLAGS.fixtures_dir:
+        fixtures = sorted(glob.glob(os.path.join(FLAGS.fixtures_dir, "*.html")))
+        if fixtures:
+            pages = []
+            for path in fixtures:
+                with open(path, "rb") as f:
+                    pages.append(f.read())
+            return [pages[i % len(pages)] for i in range(FLAGS.pages)]
+        print(f"No fixtures in {FLAGS.fixtures_dir}, using synthetic pages")
+    return [synthetic_listing_page(FLAGS.cards, i) for i in range(FLAGS.pages)]
+
+
+def run(mode: str, pages: list[bytes]) -> tuple[float, int]:
+    started = time.perf_counter()
+    if mode == "single":
+        results = [parse_listing(html, "", 10_000, mode="inline") for html in pages]
+    else:
+        # Both pools are driven from threads, as concurrent downloads would be
+        parse_mode = "inline" if mode == "thread" else "process"
+        with ThreadPoolExecutor(max_workers=available_cores()) as executor:
+            results = list(executor.map(
+                lambda html: parse_listing(html, "", 10_000, mode=parse_mode), pages))
+    return time.perf_counter() - started, sum(len(jobs) for jobs in results)
+
+
+def main(argv: list[str]) -> None:
+    del argv  # unused
+
+    pages = load_pages()
+    size_mb = sum(len(html) for html in pages) / 2**20
+    print(f"CORES: {available_cores()}")
+    print(f"PAGES: {len(pages)} ({size_mb:.1f} MiB)")
+
+    parse_pool()  # Start and warm the workers outside the measurement
+    for mode in ["single", "thread", "process"]:
+        elapsed, jobs = run(mode, pages)
+        print(f"{mode:>8}: {len(pages) / elapsed:8.1f} pages/s  "
+              f"{elapsed * 1000:8.1f} ms  ({jobs} jobs)")
+
+
+if __name__ == "__main__":
+    app.run(main)
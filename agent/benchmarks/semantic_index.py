@@ -0,0 +1,124 @@
+"""Semantic job index: build time, memory, query latency and recall.
+
+Indexes synthetic postings generated from the skill taxonomy and compares
+IVF search at several nprobe values with brute-force search over the same
+vectors. Postings of one field often tie, so recall@k counts a returned job
+as correct when it is at least as similar as the exact k-th best job:
+
+    python benchmarks/semantic_index.py --postings=100000 --nprobe=1,4,8,16
+"""
+
+from absl import app
+from absl import flags
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from student360_agent.tools.gazetteer import skill_relations, skill_taxonomy  # noqa: E402
+from student360_agent.tools.semantic_index import (  # noqa: E402
+    JobVectorIndex, dense_vectors, job_text, profile_text)
+
+FLAGS = flags.FLAGS
+flags.DEFINE_integer("postings", 100_000, "Synthetic job postings to index.")
+flags.DEFINE_integer("queries", 200, "Profiles to search for.")
+flags.DEFINE_integer("k", 10, "Jobs retrieved per query.")
+flags.DEFINE_list("nprobe", ["1", "4", "8", "16", "32"], "Inverted lists probed per query.")
+flags.DEFINE_integer("seed", 0, "Random seed for the synthetic postings.")
+
+ROLES = {
+    'backend': "Backend Developer", 'frontend': "Frontend Developer", 'mobile': "Mobile Developer",
+    'data_ai': "Data Engineer", 'cloud_devops': "DevOps Engineer", 'testing': "QA Engineer",
+    'database': "Database Administrator", 'security': "Security Engineer",
+    'embedded_hardware': "Embedded Engineer", 'game': "Game Developer",
+}
+LEVELS = ["Intern", "Fresher", "Junior", "", "Senior", "Lead"]
+
+
+def synthetic_jobs(count: int, rng: random.Random) -> list[dict]:
+    """Postings with a role and related skills, like real listings of one field"""
+    by_category: dict[str, list[str]] = {}
+    for skill, category in skill_taxonomy().items():
+        by_category.setdefault(category, []).append(skill)
+    categories = [category for category in ROLES if category in by_category]
+    languages = by_category['programming_language']
+
+    jobs = []
+    for i in range(count):
+        category = rng.choice(categories)
+        skills = rng.sample(by_category[category], min(4, len(by_category[category])))
+        related = [language for skill in skills for language in skill_relations().get(skill, [])]
+        language = rng.choice(related or languages)
+        title = f"{rng.choice(LEVELS)} {language.title()} {ROLES[category]}".strip()
+        jobs.append({
+            'title': title,
+            'company': f"Company {i % 5000}",
+            'snippet': f"Yêu cầu kinh nghiệm {', '.join(skills)}. Làm việc với {language}.",
+            'url': f"https://example.vn/jobs/{i}",
+        })
+    return jobs
+
+
+def synthetic_profiles(count: int, rng: random.Random) -> list[dict]:
+    """Student profiles: a few skills of one field, sometimes with a second field"""
+    by_category: dict[str, list[str]] = {}
+    for skill, category in skill_taxonomy().items():
+        by_category.setdefault(category, []).append(skill)
+    categories = list(by_category)
+
+    profiles = []
+    for _ in range(count):
+        skills = rng.sample(by_category[rng.choice(categories)], 2)
+        if rng.random() < 0.3:
+            skills.append(rng.choice(by_category[rng.choice(categories)]))
+        profiles.append({'skills': skills})
+    return profiles
+
+
+def main(argv: list[str]) -> None:
+    del argv  # unused
+
+    rng = random.Random(FLAGS.seed)
+    jobs = synthetic_jobs(FLAGS.postings, rng)
+
+    started = time.perf_counter()
+    vectors = dense_vectors([job_text(job) for job in jobs])
+    embed_seconds = time.perf_counter() - started
+    tracemalloc.start()
+    started = time.perf_counter()
+    index = JobVectorIndex.build(jobs, vectors=vectors)
+    build_seconds = time.perf_counter() - started
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del vectors
+
+    print(f"POSTINGS: {len(index)}  LISTS: {len(index.centroids)}")
+    print(f"EMBED: {embed_seconds:.1f}s  BUILD: {build_seconds:.1f}s")
+    print(f"INDEX MEMORY: {index.nbytes / 2**20:.1f} MiB  "
+          f"(peak while building: {peak_bytes / 2**20:.1f} MiB)")
+
+    queries = dense_vectors([profile_text(profile)
+                             for profile in synthetic_profiles(FLAGS.queries, rng)])
+    started = time.perf_counter()
+    # Similarity of the exact k-th best job for each query
+    thresholds = [index.search_exact(query, FLAGS.k)[-1][1] - 1e-4 for query in queries]
+    exact_ms = (time.perf_counter() - started) * 1000 / len(queries)
+    print(f"{'brute':>8}: {exact_ms:7.2f} ms/query  recall@{FLAGS.k} 1.000")
+
+    for nprobe in [int(value) for value in FLAGS.nprobe]:
+        started = time.perf_counter()
+        found = [index.search(query, FLAGS.k, nprobe) for query in queries]
+        elapsed_ms = (time.perf_counter() - started) * 1000 / len(queries)
+        hits = sum(sum(1 for _, similarity in results if similarity >= threshold)
+                   for results, threshold in zip(found, thresholds))
+        recall = hits / (FLAGS.k * len(queries))
+        print(f"{'nprobe=' + str(nprobe):>8}: {elapsed_ms:7.2f} ms/query  recall@{FLAGS.k} {recall:.3f}")
+
+
+if __name__ == "__main__":
+    app.run(main)
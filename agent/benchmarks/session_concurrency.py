@@ -0,0 +1,120 @@
+"""Search throughput of one replica as the number of concurrent sessions grows.
+
+Every session runs the async google_search_jobs and web_scrape_jobs tools
+against an in-process ``httpx.MockTransport`` that answers after a simulated
+upstream delay. With non-blocking tools the sessions overlap on one event
+loop, so throughput grows with the session count instead of staying at
+1 / latency. The run fails (exit status 1) when throughput at the largest
+session count is not at least ``--min_speedup`` times that of the smallest:
+
+    python benchmarks/session_concurrency.py --sessions=1,4,16,64 --delay_ms=300
+"""
+
+from absl import app
+from absl import flags
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from student360_agent.tools import async_scraper, search_quota  # noqa: E402
+from student360_agent.tools.http_client import configure_http_client  # noqa: E402
+
+FLAGS = flags.FLAGS
+flags.DEFINE_list("sessions", ["1", "4", "16", "64"], "Concurrent session counts to measure.")
+flags.DEFINE_integer("delay_ms", 300, "Simulated upstream response time.")
+flags.DEFINE_integer("cards", 20, "Job cards per simulated listing page.")
+flags.DEFINE_float("min_speedup", 4.0,
+                   "Required throughput ratio between the largest and smallest session count.")
+
+
+def listing_page(cards: int) -> bytes:
+    items = "".join(
+        f'<div class="job-item" data-cy="job-card">'
+        f'<h3 class="title"><a href="/viec-lam/job-{i}">Java Developer {i}</a></h3>'
+        f'<a class="company">Company {i}</a><label class="address">Hà Nội</label>'
+        f'<label class="salary">{10 + i} - {20 + i} triệu</label></div>'
+        for i in range(cards)
+    )
+    return f'<html><body><div class="job-list-search-result">{items}</div></body></html>'.encode()
+
+
+def search_results(query: str) -> dict:
+    return {'items': [
+        {'title': f"{query} {i} - Company {i} | TopCV",
+         'snippet': "Lương 15 - 25 triệu, làm việc tại Hà Nội",
+         'link': f"https://www.topcv.vn/viec-lam/{query.replace(' ', '-')}-{i}"}
+        for i in range(10)
+    ]}
+
+
+def install_mock_upstreams(delay: float, cards: int) -> None:
+    import httpx
+
+    page = listing_page(cards)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay)
+        if request.url.host == "www.googleapis.com":
+            body = json.dumps(search_results(request.url.params['q'])).encode()
+            return httpx.Response(200, content=body,
+                                  headers={'content-type': 'application/json'})
+        return httpx.Response(200, content=page, headers={'content-type': 'text/html'})
+
+    configure_http_client(transport=httpx.MockTransport(handler))
+
+
+async def run_session(session: int, round_id: int) -> int:
+    # Distinct queries, so nothing is coalesced or served from the result cache
+    query = f"java developer {round_id}-{session}"
+    google, scraped = await asyncio.gather(
+        async_scraper.google_search_jobs(query, "Hà Nội"),
+        async_scraper.web_scrape_jobs(query, "Hà Nội"))
+    return len(google['jobs']) + len(scraped['jobs'])
+
+
+async def run_round(sessions: int, round_id: int) -> tuple[float, int]:
+    started = time.perf_counter()
+    jobs = await asyncio.gather(*(run_session(i, round_id) for i in range(sessions)))
+    return time.perf_counter() - started, sum(jobs)
+
+
+def main(argv: list[str]) -> int:
+    del argv  # unused
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    os.environ.setdefault('GOOGLE_API_KEY', 'benchmark')
+    os.environ.setdefault('GOOGLE_CSE_ID', 'benchmark')
+    # Measure the tools, not the daily quota
+    search_quota.cse_quota.daily_quota = 10**9
+    install_mock_upstreams(FLAGS.delay_ms / 1000, FLAGS.cards)
+
+    async def run_all() -> dict[int, float]:
+        await run_round(1, -1)  # Warm up the client, parser and regex tables
+        print(f"{'SESSIONS':>8} {'ELAPSED':>10} {'SESSIONS/S':>11} {'JOBS':>6}")
+        throughput = {}
+        for round_id, sessions in enumerate(int(count) for count in FLAGS.sessions):
+            elapsed, jobs = await run_round(sessions, round_id)
+            throughput[sessions] = sessions / elapsed
+            print(f"{sessions:>8} {elapsed * 1000:>8.0f}ms {throughput[sessions]:>11.1f} {jobs:>6}")
+        return throughput
+
+    throughput = asyncio.run(run_all())
+    fewest, most = min(throughput), max(throughput)
+    speedup = throughput[most] / throughput[fewest]
+    if speedup < FLAGS.min_speedup:
+        print(f"FAIL: {most} sessions ran {speedup:.1f}x the throughput of {fewest}, "
+              f"expected at least {FLAGS.min_speedup:.1f}x")
+        return 1
+    print(f"OK: {most} sessions ran {speedup:.1f}x the throughput of {fewest}")
+    return 0
+
+
+if __name__ == "__main__":
+    app.run(main)
@@ -0,0 +1,61 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Build the local semantic job index used by find_similar_jobs.
+
+Reads collected job postings (one JSON job dictionary per line) and writes
+the index, with the jobs, to one .npz file:
+
+    python deployment/build_job_index.py --jobs=jobs.jsonl --output=job_index.npz
+"""
+
+from absl import app
+from absl import flags
+import json
+import os
+import sys
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.insert(0, parent_dir)
+
+from student360_agent.tools.semantic_index import build_job_index, job_index_path  # noqa: E402
+
+FLAGS = flags.FLAGS
+flags.DEFINE_string("jobs", None, "JSON Lines file of job postings.")
+flags.DEFINE_string("output", None, "Index file (default: $STUDENT360_JOB_INDEX).")
+flags.mark_flag_as_required("jobs")
+
+
+def main(argv: list[str]) -> None:
+    del argv  # unused
+
+    with open(FLAGS.jobs, encoding="utf-8") as f:
+        jobs = [json.loads(line) for line in f if line.strip()]
+    if not jobs:
+        print(f"No jobs in {FLAGS.jobs}")
+        return
+
+    output = FLAGS.output or job_index_path()
+    started = time.perf_counter()
+    index = build_job_index(jobs, output)
+    print(f"Indexed {len(index)} jobs in {time.perf_counter() - started:.1f}s "
+          f"({index.nbytes / 2**20:.1f} MiB): {output} "
+          f"({os.path.getsize(output) / 2**20:.1f} MiB on disk)")
+
+
+if __name__ == "__main__":
+    app.run(main)
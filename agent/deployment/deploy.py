@@ -15,62 +15,196 @@
 
 """Deployment script for Student360 Agent."""
 
+# vertexai and the agent itself are imported inside the commands that need
+# them so that flag parsing and ``--list`` do not pay for the full SDK import.
 from absl import app
 from absl import flags
 from dotenv import load_dotenv
-from vertexai.preview.reasoning_engines import AdkApp
-from vertexai import agent_engines
-import vertexai
-from student360_agent.agent import root_agent
+import glob
 import os
+import shutil
+import subprocess
 import sys
+import tempfile
 # Add the parent directory to Python path so we can import student360_agent
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
+# Direct runtime dependencies of student360_agent on Agent Engine. Deploy-time
+# tools (absl-py, python-dotenv) are deliberately not part of the bundle.
+RUNTIME_REQUIREMENTS = [
+    "google-adk (>=0.0.2)",
+    "google-cloud-aiplatform[agent_engines] (>=1.88.0,<2.0.0)",
+    "google-genai (>=1.5.0,<2.0.0)",
+    "pydantic (>=2.10.6,<3.0.0)",
+    "beautifulsoup4 (>=4.13.5)",
+    "httpx (>=0.28.1)",
+    "numpy (>=1.26)",
+]
+
+# Import statements whose time is reported for a built bundle
+BUNDLE_IMPORTS = [
+    "from student360_agent.agent import root_agent",
+    "import google.adk.agents",
+    "import bs4",
+    "import httpx",
+]
+
+BUNDLE_DIR = os.path.join(parent_dir, "build", "bundle")
+WHEEL_DIR = os.path.join(BUNDLE_DIR, "wheels")
+LOCK_FILE = os.path.join(BUNDLE_DIR, "requirements.lock")
+# Copy of the local semantic job index shipped with the agent, if one exists
+BUNDLE_JOB_INDEX = os.path.join(BUNDLE_DIR, "job_index.npz")
 
 FLAGS = flags.FLAGS
 flags.DEFINE_string("project_id", None, "GCP project ID.")
 flags.DEFINE_string("location", None, "GCP location.")
 flags.DEFINE_string("bucket", None, "GCP bucket.")
 flags.DEFINE_string("resource_id", None, "ReasoningEngine resource ID.")
+flags.DEFINE_string("python_version", f"{sys.version_info.major}.{sys.version_info.minor}",
+                    "Python version of the Agent Engine runtime (--build).")
+flags.DEFINE_string("platform", "manylinux2014_x86_64",
+                    "Wheel platform tag of the Agent Engine runtime (--build).")
 
 flags.DEFINE_bool("list", False, "list all agents.")
 flags.DEFINE_bool("create", False, "Creates a new agent.")
 flags.DEFINE_bool("delete", False, "Deletes an existing agent.")
-flags.mark_bool_flags_as_mutual_exclusive(["create", "delete"])
+flags.DEFINE_bool("build", False, "Builds the locked wheel bundle used by --create.")
+flags.mark_bool_flags_as_mutual_exclusive(["build", "create", "delete"])
+
+
+def _wheel_name_and_version(wheel_path: str) -> tuple[str, str]:
+    """Read the distribution name and version from a wheel filename."""
+    name, version = os.path.basename(wheel_path).split("-")[:2]
+    return name.replace("_", "-").lower(), version
+
+
+def _dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total
+
+
+def _bundle_wheels() -> list[str]:
+    return sorted(glob.glob(os.path.join(WHEEL_DIR, "*.whl")))
+
+
+def _locked_requirements() -> list[str]:
+    """Read the ``name==version`` pins written by --build."""
+    with open(LOCK_FILE) as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def build(python_version: str, platform: str) -> None:
+    """Builds a locked wheel bundle with the runtime closure of the agent."""
+    shutil.rmtree(BUNDLE_DIR, ignore_errors=True)
+    os.makedirs(WHEEL_DIR)
+
+    target_flags = [
+        "--only-binary=:all:",
+        "--platform", platform,
+        "--python-version", python_version,
+    ]
+
+    # Resolve and download the full dependency closure as wheels for the
+    # Agent Engine runtime, not for the machine running the build.
+    subprocess.run(
+        [sys.executable, "-m", "pip", "download", "--quiet",
+         "--dest", WHEEL_DIR, *target_flags, *RUNTIME_REQUIREMENTS],
+        check=True,
+    )
+
+    wheels = _bundle_wheels()
+    pins = sorted(_wheel_name_and_version(wheel) for wheel in wheels)
+    with open(LOCK_FILE, "w") as f:
+        f.write(f"# Generated by deploy.py --build for Python {python_version} ({platform})\n")
+        f.writelines(f"{name}=={version}\n" for name, version in pins)
+
+    wheel_bytes = sum(os.path.getsize(wheel) for wheel in wheels)
+    print(f"Locked {len(pins)} packages in {LOCK_FILE}")
+    print(f"Wheel bundle size: {wheel_bytes / 2**20:.1f} MiB")
+
+    # Install the bundle offline into a scratch site-packages to report the
+    # installed (image) size and the import time on top of it.
+    with tempfile.TemporaryDirectory() as site_dir:
+        subprocess.run(
+            [sys.executable, "-m", "pip", "install", "--quiet", "--no-deps",
+             "--no-index", "--target", site_dir, *target_flags, *wheels],
+            check=True,
+        )
+        print(f"Installed size: {_dir_size(site_dir) / 2**20:.1f} MiB")
+
+        from import_time import measure_import_time
+
+        env = {"PYTHONPATH": os.pathsep.join([site_dir, parent_dir]),
+               "PYTHONNOUSERSITE": "1"}
+        for statement in BUNDLE_IMPORTS:
+            try:
+                result = measure_import_time(statement, runs=3, env=env)
+            except RuntimeError as e:
+                # Expected when the build machine cannot run the target wheels
+                print(f"Import time of {statement!r}: unavailable ({e.__class__.__name__})")
+                continue
+            print(f"Import time of {statement!r}: {result['total_ms']:.1f} ms")
 
 
 def create() -> None:
     """Creates an agent engine for Student360 Agent."""
+    wheels = _bundle_wheels()
+    if not os.path.exists(LOCK_FILE) or not wheels:
+        print("Missing deployment bundle, run deploy.py --build first")
+        return
+
+    from vertexai.preview.reasoning_engines import AdkApp
+    from vertexai import agent_engines
+    from student360_agent.tools.semantic_index import job_index_path
+
+    # Ship the job index built by build_job_index.py; without one the agent
+    # is built without find_similar_jobs.
+    env_vars = {}
+    extra_packages = ["./student360_agent"]
+    if os.path.exists(job_index_path()):
+        shutil.copyfile(job_index_path(), BUNDLE_JOB_INDEX)
+        bundled_index = os.path.relpath(BUNDLE_JOB_INDEX, parent_dir)
+        # Extra packages are unpacked relative to the runtime's working directory
+        env_vars["STUDENT360_JOB_INDEX"] = bundled_index
+        extra_packages.append("./" + bundled_index)
+        print(f"Shipping job index {job_index_path()}")
+    else:
+        print(f"No job index at {job_index_path()}, deploying without find_similar_jobs")
+
+    from student360_agent.agent import root_agent
+
     adk_app = AdkApp(agent=root_agent, enable_tracing=True)
 
+    # Require the pins from requirements.lock (Agent Engine checks them against
+    # the agent's imports) and install them only from the shipped wheels, so
+    # every replica gets exactly the closure produced by --build.
+    wheel_dir = "./" + os.path.relpath(WHEEL_DIR, parent_dir)
     remote_agent = agent_engines.create(
         adk_app,
         display_name=root_agent.name,
-        requirements=[
-            "google-adk (>=0.0.2)",
-            "google-cloud-aiplatform[agent_engines] (>=1.88.0,<2.0.0)",
-            "google-genai (>=1.5.0,<2.0.0)",
-            "pydantic (>=2.10.6,<3.0.0)",
-            "absl-py (>=2.2.1,<3.0.0)",
-            "beautifulsoup4 (>=4.13.5)",
-            "requests (>=2.32.5)",
-            "python-dotenv (>=1.1.1)",
-        ],
-        extra_packages=["./student360_agent"],
+        requirements=["--no-index", f"--find-links={wheel_dir}", *_locked_requirements()],
+        extra_packages=[*extra_packages, wheel_dir],
+        env_vars=env_vars or None,
     )
     print(f"Created remote agent: {remote_agent.resource_name}")
 
 
 def delete(resource_id: str) -> None:
+    from vertexai import agent_engines
+
     remote_agent = agent_engines.get(resource_id)
     remote_agent.delete(force=True)
     print(f"Deleted remote agent: {resource_id}")
 
 
 def list_agents() -> None:
+    from vertexai import agent_engines
+
     remote_agents = agent_engines.list()
     TEMPLATE = '''
                 {agent.name} ("{agent.display_name}")
@@ -86,6 +220,10 @@ def main(argv: list[str]) -> None:
     del argv  # unused
     load_dotenv()
 
+    if FLAGS.build:
+        build(FLAGS.python_version, FLAGS.platform)
+        return
+
     project_id = (
         FLAGS.project_id
         if FLAGS.project_id
@@ -116,6 +254,8 @@ def main(argv: list[str]) -> None:
         )
         return
 
+    import vertexai
+
     vertexai.init(
         project=project_id,
         location=location,
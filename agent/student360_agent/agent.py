@@ -1,16 +1,8 @@
 """Student360 Multi-Agent System with proper agent orchestration."""
 
-from google.adk.tools import agent_tool
-from google.adk.agents import LlmAgent
-from student360_agent.sub_agents.career.agent import career_agent, query_agent, analysis_agent, formatter_agent
-from student360_agent.sub_agents.helper.agent import google_search_agent
+import functools
 
-# Create career agent with the tool
-orchestrator = LlmAgent(
-    name='orchestrator_agent',
-    model='gemini-2.5-flash',
-    description='Orchestrator agent that manages the workflow between sub-agents.',
-    instruction="""
+ORCHESTRATOR_INSTRUCTION = """
     You are the Student360 orchestrator agent that manages various specialized sub-agents.
     
     When users ask career-related questions (job search, career advice, job recommendations, internship opportunities):
@@ -24,11 +16,31 @@ orchestrator = LlmAgent(
     
     Always be helpful and provide accurate information based on your training knowledge. 
     Support both English and Vietnamese languages as appropriate for the user's query.
-    """,
-    tools=[agent_tool.AgentTool(agent=google_search_agent),],
-    sub_agents=[query_agent, career_agent, analysis_agent, formatter_agent],
-)
+    """
 
 
-# Main orchestrator (simplified to just the career agent for now)
-root_agent = orchestrator
+# Create the orchestrator with its sub-agents and tools
+@functools.lru_cache(maxsize=None)
+def build_orchestrator():
+    # ADK and the sub-agents are imported here so that importing this module
+    # stays cheap; ``root_agent`` is resolved lazily by ``__getattr__`` below.
+    from google.adk.tools import agent_tool
+    from google.adk.agents import LlmAgent
+    from student360_agent.sub_agents.career.agent import career_agent, query_agent, analysis_agent, formatter_agent
+    from student360_agent.sub_agents.helper.agent import google_search_agent
+
+    return LlmAgent(
+        name='orchestrator_agent',
+        model='gemini-2.5-flash',
+        description='Orchestrator agent that manages the workflow between sub-agents.',
+        instruction=ORCHESTRATOR_INSTRUCTION,
+        tools=[agent_tool.AgentTool(agent=google_search_agent),],
+        sub_agents=[query_agent, career_agent, analysis_agent, formatter_agent],
+    )
+
+
+def __getattr__(name: str):
+    # Main orchestrator (simplified to just the career agent for now)
+    if name in ("root_agent", "orchestrator"):
+        return build_orchestrator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,86 +1,154 @@
 # -------- Simplified Multi-Agent Job Search System --------
-from google.adk.agents import LlmAgent
-from student360_agent.tools.scraper import analyze_and_score_jobs, extract_user_requirements, format_job_results, google_search_jobs, merge_and_deduplicate_jobs, optimize_search_query, web_scrape_jobs
+# Agents are built on first attribute access (see ``__getattr__`` below) so
+# that importing this module does not pull in ADK and the scraping tools.
+import functools
+import os
 
 # -------- Agent Definitions --------
 
 
 # Agent 1: Query Processing Agent
-query_agent = LlmAgent(
-    name="query_processor",
-    model="gemini-2.5-flash",
-    description="Processes user input and generates optimal search queries",
-    instruction=(
-        "You process job search requests and generate optimized queries:"
-        "\n1. Parse user input to extract: skills, experience level, location, job type"
-        "\n2. Generate 3-5 search query variations using both English and Vietnamese terms"
-        "\n3. Consider Vietnamese job market terminology"
-        "\n4. Return structured query information"
-        "\nExample: 'backend java 1 năm kinh nghiệm' → ['java backend', 'java developer junior', 'lập trình viên java']"
-    ),
-    tools=[extract_user_requirements, optimize_search_query]
-)
+@functools.lru_cache(maxsize=None)
+def build_query_agent():
+    from google.adk.agents import LlmAgent
+    from student360_agent.tools.scraper import extract_user_requirements, optimize_search_query
+
+    return LlmAgent(
+        name="query_processor",
+        model="gemini-2.5-flash",
+        description="Processes user input and generates optimal search queries",
+        instruction=(
+            "You process job search requests and generate optimized queries:"
+            "\n1. Parse user input to extract: skills, experience level, location, job type"
+            "\n2. Generate 3-5 search query variations using both English and Vietnamese terms"
+            "\n3. Consider Vietnamese job market terminology"
+            "\n4. Return structured query information"
+            "\nExample: 'backend java 1 năm kinh nghiệm' → ['java backend', 'java developer junior', 'lập trình viên java']"
+        ),
+        tools=[extract_user_requirements, optimize_search_query]
+    )
+
 
 # Agent 2: Job Analysis Agent
-analysis_agent = LlmAgent(
-    name="job_analyzer",
-    model="gemini-2.5-flash",
-    description="Analyzes and scores job matches against user profile",
-    instruction=(
-        "You analyze job-user compatibility:"
-        "\n1. Score each job based on: skill match, experience fit, location, salary, company type"
-        "\n2. Provide detailed reasoning for each score"
-        "\n3. Consider Vietnamese job market context (salary ranges, company types)"
-        "\n4. Account for career growth potential"
-        "\n5. Return ranked results with explanations"
-    ),
-    tools=[analyze_and_score_jobs, merge_and_deduplicate_jobs]
-)
+@functools.lru_cache(maxsize=None)
+def build_analysis_agent():
+    from google.adk.agents import LlmAgent
+    from student360_agent.tools.async_scraper import enrich_top_jobs
+    from student360_agent.tools.scraper import analyze_and_score_jobs, merge_and_deduplicate_jobs
+
+    return LlmAgent(
+        name="job_analyzer",
+        model="gemini-2.5-flash",
+        description="Analyzes and scores job matches against user profile",
+        instruction=(
+            "You analyze job-user compatibility:"
+            "\n1. Score each job based on: skill match, experience fit, location, salary, company type"
+            "\n2. Provide detailed reasoning for each score"
+            "\n3. Consider Vietnamese job market context (salary ranges, company types)"
+            "\n4. Account for career growth potential"
+            "\n5. Refine the ranking of the top candidates with enrich_top_jobs"
+            "\n6. Return ranked results with explanations"
+        ),
+        tools=[analyze_and_score_jobs, enrich_top_jobs, merge_and_deduplicate_jobs]
+    )
+
 
 # Agent 3: Response Formatter Agent
-formatter_agent = LlmAgent(
-    name="response_formatter",
-    model="gemini-2.5-flash",
-    description="Formats final job recommendations in user-friendly Vietnamese format",
-    instruction=(
-        "You create polished job recommendation reports:"
-        "\n1. Format top 5-7 jobs in clean, scannable markdown"
-        "\n2. Use Vietnamese headers and friendly language"
-        "\n3. Include match percentages, key reasons, and direct apply links"
-        "\n4. Add contextual application tips"
-        "\n5. Suggest search improvements if results are weak"
-        "\nStyle: Professional but friendly, actionable, encouraging"
-    ),
-    tools=[format_job_results]
-)
+@functools.lru_cache(maxsize=None)
+def build_formatter_agent():
+    from google.adk.agents import LlmAgent
+    from student360_agent.tools.scraper import format_job_results
+
+    return LlmAgent(
+        name="response_formatter",
+        model="gemini-2.5-flash",
+        description="Formats final job recommendations in user-friendly Vietnamese format",
+        instruction=(
+            "You create polished job recommendation reports:"
+            "\n1. Format top 5-7 jobs in clean, scannable markdown"
+            "\n2. Use Vietnamese headers and friendly language"
+            "\n3. Include match percentages, key reasons, and direct apply links"
+            "\n4. Add contextual application tips"
+            "\n5. Suggest search improvements if results are weak"
+            "\nStyle: Professional but friendly, actionable, encouraging"
+        ),
+        tools=[format_job_results]
+    )
 
 # -------- LLM Agent Orchestrator --------
 
-career_agent = LlmAgent(
-    name="job_search_coordinator",
-    model="gemini-2.5-flash",
-    description="Coordinates entire job search workflow",
-    instruction=(
-        "You are the main coordinator for job search:"
-        "\n1. Take user job request and profile"
-        "\n2. Generate optimized search queries"
-        "\n3. Execute both Google search and web scraping in parallel"
-        "\n4. Merge, deduplicate, and analyze results"
-        "\n5. Score jobs against user profile"
-        "\n6. Format final recommendations"
-        "\nExecute all steps systematically. Provide progress updates. Handle errors gracefully."
-    ),
-    tools=[
-        # Query tools
-        extract_user_requirements,
-        optimize_search_query,
-        # Search tools
-        google_search_jobs,
-        web_scrape_jobs,
-        # Analysis tools
-        merge_and_deduplicate_jobs,
-        analyze_and_score_jobs,
-        # Formatting tools
-        format_job_results
-    ]
-)
+
+@functools.lru_cache(maxsize=None)
+def build_career_agent():
+    from google.adk.agents import LlmAgent
+    from student360_agent.tools.async_scraper import enrich_top_jobs, google_search_jobs, web_scrape_jobs
+    from student360_agent.tools.scraper import analyze_and_score_jobs, extract_user_requirements, format_job_results, merge_and_deduplicate_jobs, optimize_search_query
+    from student360_agent.tools.parsing import PARSE_MODE, parse_pool
+    from student360_agent.tools.semantic_index import find_similar_jobs, job_index_path
+    from student360_agent.tools.session_cache import refine_job_results
+
+    if PARSE_MODE == "process":
+        # Start and warm the parse workers now, not on the first user's scrape
+        parse_pool()
+
+    # Only offer the local job index when one is configured (see build_job_index.py)
+    has_job_index = os.path.exists(job_index_path())
+    similar_jobs_instruction = (
+        "\nfind_similar_jobs adds semantically related jobs from the local job index; merge its 'jobs' with the"
+        " search results when live searches return few matches."
+    ) if has_job_index else ""
+
+    return LlmAgent(
+        name="job_search_coordinator",
+        model="gemini-2.5-flash",
+        description="Coordinates entire job search workflow",
+        instruction=(
+            "You are the main coordinator for job search:"
+            "\n1. Take user job request and profile"
+            "\n2. Generate optimized search queries"
+            "\n3. Execute both Google search and web scraping in parallel"
+            "\n4. Merge, deduplicate, and analyze results"
+            "\n5. Score jobs against user profile, then call enrich_top_jobs to re-rank the top candidates"
+            "\n6. Format final recommendations"
+            "\nSearch tools return 'jobs' plus 'skipped_sources'; merge the 'jobs' lists and, when results are"
+            " partial, tell the user which sources were skipped because they were down or too slow."
+            "\nFor follow-ups that refine the previous search (location, level, keywords, 'show more'), call"
+            " refine_job_results first and format its scored_jobs; search again only if it returns needs_new_search."
+            "\nMerged jobs carry 'seen' when the user was shown them before; when the user asks for new jobs only,"
+            " call merge_and_deduplicate_jobs with new_only=true."
+            + similar_jobs_instruction +
+            "\nExecute all steps systematically. Provide progress updates. Handle errors gracefully."
+        ),
+        tools=[
+            # Query tools
+            extract_user_requirements,
+            refine_job_results,
+            optimize_search_query,
+            # Search tools (async: they do not block other sessions)
+            google_search_jobs,
+            web_scrape_jobs,
+            *([find_similar_jobs] if has_job_index else []),
+            # Analysis tools
+            merge_and_deduplicate_jobs,
+            analyze_and_score_jobs,
+            enrich_top_jobs,
+            # Formatting tools
+            format_job_results
+        ]
+    )
+
+
+_AGENT_BUILDERS = {
+    "query_agent": build_query_agent,
+    "analysis_agent": build_analysis_agent,
+    "formatter_agent": build_formatter_agent,
+    "career_agent": build_career_agent,
+}
+
+
+def __getattr__(name: str):
+    """Build agents lazily so ``from ... import career_agent`` keeps working."""
+    builder = _AGENT_BUILDERS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return builder()
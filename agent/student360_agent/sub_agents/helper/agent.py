@@ -1,12 +1,23 @@
-from google.adk.agents import Agent
-from google.adk.tools import google_search
+import functools
 
 
 # Create an agent with google search tool as a search specialist
-google_search_agent = Agent(
-    model='gemini-2.5-flash',
-    name='google_search_agent',
-    description='A search agent that uses google search to get latest information about current events, weather, or business hours.',
-    instruction='Use google search to answer user questions about real-time, logistical information.',
-    tools=[google_search],
-)
+@functools.lru_cache(maxsize=None)
+def build_google_search_agent():
+    from google.adk.agents import Agent
+    from google.adk.tools import google_search
+
+    return Agent(
+        model='gemini-2.5-flash',
+        name='google_search_agent',
+        description='A search agent that uses google search to get latest information about current events, weather, or business hours.',
+        instruction='Use google search to answer user questions about real-time, logistical information.',
+        tools=[google_search],
+    )
+
+
+def __getattr__(name: str):
+    """Build ``google_search_agent`` on first access."""
+    if name == "google_search_agent":
+        return build_google_search_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,280 @@
+# -------- Async Search Tools --------
+# ``async def`` versions of the search tools for the agent. ADK awaits them on
+# its event loop, so a slow job site only suspends the session that is waiting
+# for it instead of holding a worker thread that other sessions need.
+# Query building and result parsing live in ``scraper.py`` with the tools that
+# do no I/O.
+
+from typing import TYPE_CHECKING
+import asyncio
+import os
+import random
+
+from student360_agent.tools.http_client import http_client
+from student360_agent.tools.job_details import fetch_job_descriptions
+from student360_agent.tools.parsing import parse_listing
+from student360_agent.tools.resilience import CircuitOpenError, Deadline, async_call_with_resilience
+from student360_agent.tools.scraper import (
+    GOOGLE_SEARCH_DEADLINE_SECONDS, GOOGLE_SEARCH_URL, MAX_LISTING_BYTES, SCRAPE_DEADLINE_SECONDS,
+    SCRAPE_HEADERS, SCRAPE_HEDGE_AFTER_SECONDS, STREAM_CHUNK_BYTES, ListingPageReader,
+    build_google_query, google_search_params, jobs_from_google_results,
+    rerank_with_descriptions, scrape_result, topcv_listing_url)
+from student360_agent.tools.search_quota import (
+    BACKGROUND, FRESH_RESULT_TTL_SECONDS, INTERACTIVE, STALE_RESULT_TTL_SECONDS, QuotaExhausted,
+    cse_async_flight, cse_quota, cse_results, search_key)
+from student360_agent.tools.seen_jobs import filter_new_jobs
+from student360_agent.tools.session_cache import store_search_results
+
+if TYPE_CHECKING:
+    from google.adk.tools import ToolContext
+
+# Time budget for fetching the detail pages of the top-k jobs
+ENRICH_DEADLINE_SECONDS = 15.0
+
+
+async def fetch_listing_page(url: str, max_jobs: int, timeout: float,
+                             max_bytes: int = MAX_LISTING_BYTES) -> bytes:
+    """
+    Stream a listing page until enough job cards have been received
+
+    Args:
+        url: Listing page URL
+        max_jobs: Number of job cards wanted
+        timeout: Timeout (seconds) for this request
+        max_bytes: Maximum body size to read
+
+    Returns:
+        The (possibly truncated) raw HTML body
+    """
+    reader = ListingPageReader(max_jobs, max_bytes)
+    async with http_client().stream("GET", url, headers=SCRAPE_HEADERS,
+                                    timeout=timeout) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes(STREAM_CHUNK_BYTES):
+            if reader.feed(chunk):
+                break
+    return bytes(reader.body)
+
+
+async def google_search_jobs(query: str, location: str = "", max_results: int = 10) -> dict:
+    """
+    Use Google Custom Search API to find job postings from Vietnamese job sites
+
+    Identical searches running at the same time on this replica share one API
+    call. When the daily quota is nearly used up, cached or scraped results
+    are returned instead ('degraded').
+
+    Args:
+        query: Job search terms (e.g., "backend developer java")
+        location: Location preference (e.g., "TP.HCM", "Hà Nội")
+        max_results: Maximum number of results to return
+
+    Returns:
+        dict with 'jobs' (job dictionaries with basic info from Google search),
+        'skipped_sources' (sources that were down or too slow) and 'partial'
+    """
+    # Agent searches always answer a user waiting for them
+    return await _google_search(query, location, max_results, INTERACTIVE)
+
+
+async def digest_new_jobs(user_id: str, query: str, location: str = "",
+                          max_results: int = 10) -> list[dict]:
+    """
+    Search for jobs a user has not been shown yet, for digest notifications
+
+    Not an agent tool: digests run in the background, so they only use the
+    Custom Search quota left above the interactive reserve and otherwise fall
+    back to cached or scraped results.
+
+    Args:
+        user_id: User the digest is for
+        query: Job search terms
+        location: Location preference
+        max_results: Maximum number of results to search for
+
+    Returns:
+        The new jobs, which are now recorded as seen
+    """
+    result = await _google_search(query, location, max_results, BACKGROUND)
+    return filter_new_jobs(user_id, result['jobs'])
+
+
+async def _google_search(query: str, location: str, max_results: int, priority: str) -> dict:
+    """Custom Search for google_search_jobs, admitted against the quota at ``priority``"""
+    import httpx
+
+    # Get API credentials
+    api_key = os.getenv('GOOGLE_API_KEY')
+    search_engine_id = os.getenv('GOOGLE_CSE_ID')
+
+    if not api_key or not search_engine_id:
+        print("Google API credentials not found, using fallback scraping")
+        return {'jobs': [], 'skipped_sources': ['google'], 'partial': True}
+
+    key = search_key(query, location, max_results)
+    cached = cse_results.get(key, FRESH_RESULT_TTL_SECONDS)
+    if cached is not None:
+        return {'jobs': [dict(job) for job in cached], 'skipped_sources': [], 'partial': False}
+
+    params = google_search_params(api_key, search_engine_id,
+                                  build_google_query(query, location), max_results)
+
+    attempts = 0
+
+    async def fetch(timeout: float) -> dict:
+        nonlocal attempts
+        attempts += 1
+        if attempts > 1:
+            # The first attempt was counted when the search was admitted
+            cse_quota.record_call()
+        response = await http_client().get(GOOGLE_SEARCH_URL, params=params,
+                                           timeout=min(10, timeout))
+        if response.status_code == 429 and 'per day' in response.text:
+            cse_quota.mark_exhausted()
+        response.raise_for_status()
+        return response.json()
+
+    async def search() -> list[dict]:
+        cse_quota.admit(priority)
+        # No hedging here: a duplicate request would burn Custom Search quota
+        data = await async_call_with_resilience(
+            'google', fetch, Deadline(GOOGLE_SEARCH_DEADLINE_SECONDS), attempts=2)
+
+        jobs = jobs_from_google_results(data, location)
+        cse_results.put(key, jobs)
+        return jobs
+
+    try:
+        # Identical searches in flight on this replica share one API call
+        jobs = await cse_async_flight.do(key, search)
+        return {'jobs': [dict(job) for job in jobs], 'skipped_sources': [], 'partial': False}
+
+    except QuotaExhausted as e:
+        print(f"Google search quota: {e}")
+        return await _degraded_google_search(key, query, location, max_results)
+    except CircuitOpenError as e:
+        print(f"Skipping Google search: {e}")
+    except httpx.HTTPError as e:
+        print(f"Google API request error: {e}")
+    except Exception as e:
+        print(f"Google search error: {e}")
+    return {'jobs': [], 'skipped_sources': ['google'], 'partial': True}
+
+
+async def _degraded_google_search(key: str, query: str, location: str, max_results: int) -> dict:
+    """Serve a search from stale cached results, or scraping, instead of the API"""
+    cached = cse_results.get(key, STALE_RESULT_TTL_SECONDS)
+    if cached is not None:
+        return {'jobs': [dict(job) for job in cached], 'skipped_sources': ['google'],
+                'partial': True, 'degraded': True}
+
+    scraped = await web_scrape_jobs(query, location, pages=1, max_results=max_results)
+    return {'jobs': scraped['jobs'],
+            'skipped_sources': ['google'] + scraped['skipped_sources'],
+            'partial': True, 'degraded': True}
+
+
+async def web_scrape_jobs(query: str, location: str = "", pages: int = 1,
+                          max_results: int = 30) -> dict:
+    """
+    Enhanced web scraping for job sites with better reliability
+
+    Args:
+        query: Search query
+        location: Location filter
+        pages: Number of pages to scrape
+        max_results: Maximum number of jobs to collect per site
+
+    Returns:
+        dict with 'jobs' (detailed job dictionaries), 'skipped_sources'
+        (sites that were down, too slow or out of time) and 'partial'
+    """
+
+    async def scrape_topcv(query: str, location: str, page: int, deadline: Deadline,
+                           limit: int) -> list[dict]:
+        """Scrape TopCV with improved selectors"""
+        url = topcv_listing_url(query, location, page)
+
+        async def fetch(timeout: float) -> bytes:
+            return await fetch_listing_page(url, limit, min(15, timeout))
+
+        html = await async_call_with_resilience(
+            'topcv', fetch, deadline, hedge_after=SCRAPE_HEDGE_AFTER_SECONDS)
+
+        # Parsing is CPU-bound: keep it off the event loop
+        return await asyncio.to_thread(parse_listing, html, location, limit)
+
+    async def scrape_vietnamworks(query: str, location: str, page: int, deadline: Deadline,
+                                  limit: int) -> list[dict]:
+        """Scrape VietnamWorks with enhanced error handling"""
+        return []
+
+    async def scrape_topdev(query: str, location: str, page: int, deadline: Deadline,
+                            limit: int) -> list[dict]:
+        """Scrape TopDev for tech jobs"""
+        return []
+
+    async def scrape_source(source: str, scraper, deadline: Deadline) -> tuple[list[dict], bool]:
+        """Scrape the pages of one site; returns its jobs and whether it was skipped"""
+        jobs_found = []
+        for page in range(1, pages + 1):
+            try:
+                jobs = await scraper(query, location, page, deadline,
+                                     max_results - len(jobs_found))
+                jobs_found.extend(jobs)
+            except CircuitOpenError as e:
+                print(f"Skipping {source}: {e}")
+                return jobs_found, True
+            except Exception as e:
+                # Keep pages already scraped from this source, skip the rest
+                print(f"Error scraping {source}: {e}")
+                return jobs_found, True
+            if len(jobs_found) >= max_results or not jobs:
+                break
+            if page < pages:
+                # Rate limiting, without sleeping past the deadline
+                await asyncio.sleep(min(random.uniform(1, 2), deadline.remaining()))
+        return jobs_found, False
+
+    # Sites are independent, so they are scraped concurrently
+    deadline = Deadline(SCRAPE_DEADLINE_SECONDS)
+    scrapers = [('topcv', scrape_topcv),
+                ('vietnamworks', scrape_vietnamworks),
+                ('topdev', scrape_topdev)]
+    results = await asyncio.gather(
+        *(scrape_source(source, scraper, deadline) for source, scraper in scrapers))
+
+    all_jobs = []
+    skipped_sources = []
+    for (source, _), (jobs, skipped) in zip(scrapers, results):
+        all_jobs.extend(jobs)
+        if skipped:
+            skipped_sources.append(source)
+
+    return scrape_result(all_jobs, skipped_sources)
+
+
+async def enrich_top_jobs(scored_jobs: list[dict], user_profile: dict, top_k: int = 5,
+                          tool_context: "ToolContext | None" = None) -> list[dict]:
+    """
+    Fetch full job descriptions for the top-k jobs and re-score them
+
+    Only the current top candidates are fetched (with bounded concurrency and
+    a detail-page cache), so better ranking costs k fetches instead of one
+    per job.
+
+    Args:
+        scored_jobs: Ranked output of analyze_and_score_jobs
+        user_profile: User profile with preferences
+        top_k: Number of top jobs to enrich
+
+    Returns:
+        Re-ranked list of jobs with scores and reasoning
+    """
+    descriptions = await fetch_job_descriptions(
+        [item['job'].get('url', '') for item in scored_jobs[:top_k]],
+        Deadline(ENRICH_DEADLINE_SECONDS))
+
+    ranked = rerank_with_descriptions(scored_jobs, descriptions, user_profile, top_k)
+    store_search_results(tool_context, ranked)
+    return ranked
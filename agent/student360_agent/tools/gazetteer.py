@@ -0,0 +1,217 @@
+# -------- Gazetteer Matching --------
+# Token-trie gazetteers over diacritic-folded text: "Hà Nội", "ha noi" and
+# "HN" all map to the same province, and about 600 skills (1,100 phrases with
+# their synonyms) are matched in one left-to-right pass whose cost does not
+# depend on the size of the vocabulary. Short names that are also common Vietnamese words
+# once folded ("ai" is "who", "soc" is "Sóc Trăng") are matched case-sensitively
+# on the original text instead ("AI", "SOC").
+
+from typing import NamedTuple
+import functools
+import json
+import os
+import re
+import unicodedata
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Tokens keep the punctuation that is part of tech names (node.js, c++, c#, .net)
+_TOKEN_PATTERN = re.compile(r"\.?[a-z0-9][a-z0-9+#.]*")
+# Runs of the original text that contain one or more tokens
+_RUN_PATTERN = re.compile(r"[\w+#.]+")
+
+# Value stored at the end of a phrase in the trie
+_END = "\0"
+
+
+def fold_text(text: str) -> str:
+    """Lowercase and strip Vietnamese diacritics ("Hà Nội" -> "ha noi")"""
+    text = unicodedata.normalize("NFD", text.lower().replace("đ", "d"))
+    return "".join(ch for ch in text if unicodedata.category(ch) != "Mn")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split folded text into tokens, dropping sentence-final periods"""
+    return [token.rstrip(".") for token in _TOKEN_PATTERN.findall(fold_text(text))]
+
+
+def original_tokens(text: str) -> list[str]:
+    """
+    The unfolded, case-preserved form of each token of ``tokenize(text)``
+
+    Tokens that are only part of a run of the original text ("a" and "b" in
+    "a_b") have no original form and are returned as "".
+    """
+    originals = []
+    for run in _RUN_PATTERN.findall(text):
+        count = len(_TOKEN_PATTERN.findall(fold_text(run)))
+        originals.extend([run.rstrip(".")] if count == 1 else [""] * count)
+    return originals
+
+
+class GazetteerMatch(NamedTuple):
+    value: str
+    start: int  # Token index of the first matched token
+    end: int    # Token index after the last matched token
+
+
+class Gazetteer:
+    """
+    Phrase dictionary matched on token boundaries
+
+    Phrases are stored in a trie keyed by folded tokens. Matching is
+    leftmost-longest: at each position the trie is walked at most as deep as
+    the longest phrase, so extraction is linear in the input length.
+    """
+
+    def __init__(self):
+        self._root = {}
+        # Phrases matched on the original text, e.g. "AI" but not "ai"
+        self._case_sensitive_root = {}
+        self._size = 0
+        self.max_phrase_tokens = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, phrase: str, value: str, case_sensitive: bool = False) -> None:
+        if case_sensitive:
+            tokens, node = original_tokens(phrase), self._case_sensitive_root
+        else:
+            tokens, node = tokenize(phrase), self._root
+        if not tokens:
+            return
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if _END not in node:
+            self._size += 1
+        node[_END] = value
+        self.max_phrase_tokens = max(self.max_phrase_tokens, len(tokens))
+
+    def _longest_match(self, root: dict, tokens: list[str], i: int) -> GazetteerMatch | None:
+        node = root
+        best = None
+        for j in range(i, min(len(tokens), i + self.max_phrase_tokens)):
+            node = node.get(tokens[j])
+            if node is None:
+                break
+            if _END in node:
+                best = GazetteerMatch(node[_END], i, j + 1)
+        return best
+
+    def find_all(self, text: str) -> list[GazetteerMatch]:
+        tokens = tokenize(text)
+        originals = original_tokens(text) if self._case_sensitive_root else None
+        matches = []
+        i = 0
+        while i < len(tokens):
+            best = self._longest_match(self._root, tokens, i)
+            if originals:
+                exact = self._longest_match(self._case_sensitive_root, originals, i)
+                if exact and (best is None or exact.end > best.end):
+                    best = exact
+            if best:
+                matches.append(best)
+                i = best.end
+            else:
+                i += 1
+        return matches
+
+    def values(self, text: str) -> list[str]:
+        """Distinct matched values in order of first appearance"""
+        return list(dict.fromkeys(match.value for match in self.find_all(text)))
+
+
+def _load_json(name: str):
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=None)
+def province_gazetteer() -> Gazetteer:
+    """All 63 provinces and municipalities of Vietnam, with city aliases"""
+    gazetteer = Gazetteer()
+    for province in _load_json("vn_provinces.json"):
+        for phrase in [province['name'], *province['aliases']]:
+            gazetteer.add(phrase, province['name'])
+    return gazetteer
+
+
+@functools.lru_cache(maxsize=None)
+def skill_taxonomy() -> dict[str, str]:
+    """Map of canonical skill name to its category"""
+    return {skill['name']: skill['category'] for skill in _load_json("skills.json")}
+
+
+@functools.lru_cache(maxsize=None)
+def skill_relations() -> dict[str, list[str]]:
+    """Map of canonical skill name to the languages it belongs to (spring boot -> java)"""
+    return {skill['name']: skill['related']
+            for skill in _load_json("skills.json") if skill.get('related')}
+
+
+@functools.lru_cache(maxsize=None)
+def skill_gazetteer() -> Gazetteer:
+    """Skill taxonomy with synonyms, matched to canonical skill names"""
+    gazetteer = Gazetteer()
+    for skill in _load_json("skills.json"):
+        # A name listed as case-sensitive ("SOC") is not also matched folded
+        case_sensitive = skill.get('case_sensitive', [])
+        folded = {fold_text(phrase) for phrase in case_sensitive}
+        for phrase in [skill['name'], *skill['aliases']]:
+            if fold_text(phrase) not in folded:
+                gazetteer.add(phrase, skill['name'])
+        for phrase in case_sensitive:
+            gazetteer.add(phrase, skill['name'], case_sensitive=True)
+    return gazetteer
+
+
+def _term_gazetteer(terms: dict[str, list[str]],
+                    case_sensitive_terms: dict[str, list[str]] | None = None) -> Gazetteer:
+    gazetteer = Gazetteer()
+    for value, phrases in terms.items():
+        for phrase in phrases:
+            gazetteer.add(phrase, value)
+    for value, phrases in (case_sensitive_terms or {}).items():
+        for phrase in phrases:
+            gazetteer.add(phrase, value, case_sensitive=True)
+    return gazetteer
+
+
+@functools.lru_cache(maxsize=None)
+def experience_gazetteer() -> Gazetteer:
+    return _term_gazetteer({
+        'intern': ['intern', 'internship', 'thực tập', 'thực tập sinh', 'fresher', 'trainee'],
+        'junior': ['junior', 'mới ra trường', 'mới tốt nghiệp'],
+        'senior': ['senior', 'kinh nghiệm', 'lead', 'trưởng nhóm'],
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def job_type_gazetteer() -> Gazetteer:
+    return _term_gazetteer({
+        'part-time': ['part-time', 'part time', 'parttime', 'bán thời gian'],
+        'internship': ['internship', 'thực tập', 'thực tập sinh'],
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def category_gazetteer() -> Gazetteer:
+    """Role words that name a skill category ("backend" -> backend)"""
+    return _term_gazetteer({
+        'backend': ['backend', 'back-end', 'back end', 'server side', 'server-side'],
+        'frontend': ['frontend', 'front-end', 'front end', 'giao diện web'],
+        'mobile': ['mobile', 'mobile app', 'ứng dụng di động', 'di động'],
+        'data_ai': ['data', 'dữ liệu', 'trí tuệ nhân tạo'],
+        'cloud_devops': ['devops', 'cloud', 'sre', 'hạ tầng', 'infrastructure'],
+        'testing': ['tester', 'kiểm thử', 'qa engineer', 'qc engineer'],
+        'security': ['bảo mật', 'an ninh mạng', 'cybersecurity'],
+        'design': ['designer', 'thiết kế'],
+        'embedded_hardware': ['embedded', 'phần cứng', 'firmware'],
+        'game': ['game', 'trò chơi'],
+        'blockchain': ['web3', 'crypto'],
+    }, case_sensitive_terms={
+        # Folded, these are "ai" (who) and "nhung" (but)
+        'data_ai': ['AI'],
+        'embedded_hardware': ['nhúng', 'Nhúng'],
+    })
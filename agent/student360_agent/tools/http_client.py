@@ -0,0 +1,54 @@
+# -------- Shared HTTP Client --------
+# One pooled ``httpx.AsyncClient`` per event loop, shared by every async tool
+# so sessions reuse connections to the job sites instead of opening their own.
+
+# httpx is imported inside the functions that need it so that importing this
+# module (and therefore the agent) stays cheap on cold start.
+from typing import TYPE_CHECKING
+import asyncio
+import weakref
+
+if TYPE_CHECKING:
+    import httpx
+
+# Connections kept open per replica; every session shares the same pool
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+
+# Keyword arguments for new clients, see ``configure_http_client``
+_client_options: dict = {}
+# httpx connection pools cannot be shared between event loops
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary())
+
+
+def configure_http_client(**options) -> None:
+    """
+    Set the options used to create the shared ``httpx.AsyncClient``
+
+    Clients already created are discarded, so this is meant to be called at
+    startup (or by benchmarks to install an ``httpx.MockTransport``).
+
+    Args:
+        **options: Keyword arguments for ``httpx.AsyncClient``
+    """
+    _client_options.clear()
+    _client_options.update(options)
+    _clients.clear()
+
+
+def http_client() -> "httpx.AsyncClient":
+    """Return the pooled HTTP client for the running event loop"""
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        options = {
+            'limits': httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                                   max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS),
+            'follow_redirects': True,
+            **_client_options,
+        }
+        client = _clients[loop] = httpx.AsyncClient(**options)
+    return client
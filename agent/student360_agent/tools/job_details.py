@@ -0,0 +1,144 @@
+# -------- Job Detail Pages --------
+# Fetching and parsing of full job descriptions, used to enrich only the
+# current top-k candidates after a first scoring pass.
+
+from collections import OrderedDict
+from urllib.parse import urlparse
+import asyncio
+import threading
+import time
+
+from student360_agent.tools.http_client import http_client
+from student360_agent.tools.resilience import Deadline, async_call_with_resilience
+
+# Detail pages fetched at the same time for one enrichment call
+DETAIL_FETCH_CONCURRENCY = 4
+# Detail pages are much larger than the description we need
+MAX_DETAIL_BYTES = 1024 * 1024
+DETAIL_MAX_CHARS = 4000
+DETAIL_CACHE_SIZE = 512
+DETAIL_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+DESCRIPTION_SELECTORS = [
+    ".job-description",
+    ".job-detail__information-detail",
+    "[class*='job-description']",
+    "#job-detail",
+    "article",
+    "main",
+]
+
+
+class DetailCache:
+    """Thread-safe LRU cache of job descriptions keyed by URL, with a TTL"""
+
+    def __init__(self, max_entries: int = DETAIL_CACHE_SIZE,
+                 ttl_seconds: float = DETAIL_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            stored_at, description = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[url]
+                return None
+            self._entries.move_to_end(url)
+            return description
+
+    def put(self, url: str, description: str) -> None:
+        with self._lock:
+            self._entries[url] = (time.monotonic(), description)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+detail_cache = DetailCache()
+
+
+def parse_job_description(html: bytes) -> str:
+    """Extract the job description text from a detail page"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    for tag in soup(["script", "style", "noscript", "header", "footer", "nav"]):
+        tag.decompose()
+
+    for selector in DESCRIPTION_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            text = element.get_text(" ", strip=True)
+            if text:
+                return text[:DETAIL_MAX_CHARS]
+
+    meta = soup.find("meta", attrs={"name": "description"})
+    if meta and meta.get("content"):
+        return meta["content"].strip()[:DETAIL_MAX_CHARS]
+    return ""
+
+
+async def fetch_job_description(url: str, deadline: Deadline) -> str:
+    """Fetch one detail page through the cache and its site's detail-page circuit breaker"""
+    cached = detail_cache.get(url)
+    if cached is not None:
+        return cached
+
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Accept-Language": "vi-VN,vi;q=0.9,en;q=0.8",
+    }
+
+    async def fetch(timeout: float) -> bytes:
+        body = bytearray()
+        async with http_client().stream("GET", url, headers=headers,
+                                        timeout=min(10, timeout)) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(16 * 1024):
+                body.extend(chunk)
+                if len(body) >= MAX_DETAIL_BYTES:
+                    del body[MAX_DETAIL_BYTES:]
+                    break
+        return bytes(body)
+
+    # Detail pages get their own breaker per site ("topcv-detail"): dead
+    # postings during optional enrichment must never skip the listing scrape
+    upstream = urlparse(url).netloc.removeprefix("www.").split(".")[0] + "-detail"
+    html = await async_call_with_resilience(upstream, fetch, deadline, attempts=1)
+    # Parsing is CPU-bound: keep it off the event loop
+    description = await asyncio.to_thread(parse_job_description, html)
+    detail_cache.put(url, description)
+    return description
+
+
+async def fetch_job_descriptions(urls: list[str], deadline: Deadline,
+                                 max_concurrency: int = DETAIL_FETCH_CONCURRENCY) -> dict[str, str]:
+    """
+    Fetch detail pages with bounded concurrency
+
+    Args:
+        urls: Detail page URLs
+        deadline: Overall deadline for all fetches
+        max_concurrency: Maximum number of concurrent fetches
+
+    Returns:
+        dict mapping URL to description for the pages that could be fetched
+    """
+    urls = list(dict.fromkeys(url for url in urls if url and url.startswith("http")))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_one(url: str) -> tuple[str, str]:
+        async with semaphore:
+            try:
+                return url, await fetch_job_description(url, deadline)
+            except Exception as e:
+                print(f"Error fetching job details {url}: {e}")
+                return url, ""
+
+    results = await asyncio.gather(*(fetch_one(url) for url in urls))
+    return {url: description for url, description in results if description}
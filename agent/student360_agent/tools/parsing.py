@@ -0,0 +1,164 @@
+# -------- HTML Parsing --------
+# Listing-page parsing, optionally offloaded to a pool of warm worker
+# processes so multi-page scrapes are not serialized on the GIL. Workers only
+# send compact job records back.
+
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import multiprocessing
+import os
+import re
+import threading
+
+# "inline" parses in the calling thread, "process" uses the worker pool
+PARSE_MODE = os.getenv("STUDENT360_PARSE_MODE", "inline")
+
+
+@functools.lru_cache(maxsize=None)
+def job_card_markers() -> dict:
+    """Compile the raw-HTML job card markers on first use"""
+    return {
+        'data-cy': re.compile(rb"""data-cy=["']job-card["']"""),
+        # "-" is a word boundary for \b, so exclude it to skip job-item-search-result
+        'class': re.compile(rb"""class=["'][^"']*(?<![\w-])job-item(?![\w-])"""),
+    }
+
+
+def _has_job_item_class(value) -> bool:
+    """Match the job-item class token, like ``.job-item`` ("job-item box" too)"""
+    if not value:
+        return False
+    tokens = value.split() if isinstance(value, str) else value
+    return 'job-item' in tokens
+
+
+def parse_topcv_cards(html: bytes, location: str, max_jobs: int) -> list[dict]:
+    """
+    Parse TopCV job cards, building a tree only for the job card subtrees
+
+    Args:
+        html: Raw listing page HTML (may be truncated)
+        location: Location used when a card has none
+        max_jobs: Maximum number of jobs to return
+
+    Returns:
+        list of job dictionaries
+    """
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # Keep only the card subtrees instead of the whole page (header, footer,
+    # scripts); the marker found in the raw HTML picks the card layout.
+    markers = job_card_markers()
+    if markers['data-cy'].search(html):
+        only_cards = SoupStrainer(attrs={'data-cy': 'job-card'})
+    elif markers['class'].search(html):
+        only_cards = SoupStrainer(attrs={'class': _has_job_item_class})
+    else:
+        return []
+
+    soup = BeautifulSoup(html, 'html.parser', parse_only=only_cards)
+    jobs = []
+
+    # Multiple selector strategies for robustness
+    job_selectors = [
+        "[data-cy='job-card']",
+        ".job-item",
+    ]
+
+    cards = []
+    for selector in job_selectors:
+        cards = soup.select(selector)
+        if cards:
+            break
+
+    for card in cards:
+        if len(jobs) >= max_jobs:
+            break
+
+        # Try multiple title selectors
+        title_el = None
+        title_selectors = ["a[href*='/viec-lam/']",
+                           ".title a", "h3 a", ".job-title a"]
+        for sel in title_selectors:
+            title_el = card.select_one(sel)
+            if title_el:
+                break
+
+        if not title_el:
+            continue
+
+        # Extract other info with fallbacks
+        company_el = card.select_one(
+            ".company, .job-company, [data-cy='company-name'], .company-name")
+        loc_el = card.select_one(
+            ".address, .location, [data-cy='job-location'], .job-location")
+        salary_el = card.select_one(
+            ".salary, [data-cy='job-salary'], .job-salary")
+
+        job_url = title_el.get("href", "")
+        if job_url and job_url.startswith("/"):
+            job_url = "https://www.topcv.vn" + job_url
+
+        jobs.append({
+            'title': title_el.get_text(strip=True),
+            'company': company_el.get_text(strip=True) if company_el else "",
+            'location': loc_el.get_text(strip=True) if loc_el else location,
+            'salary': salary_el.get_text(strip=True) if salary_el else "Thỏa thuận",
+            'url': job_url,
+            'source': 'topcv'
+        })
+
+    return jobs
+
+
+def available_cores() -> int:
+    """Number of cores this process may run on (respects CPU affinity)"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _warm_worker() -> None:
+    """Import and exercise bs4 once so the first real parse is not cold"""
+    parse_topcv_cards(b'<div class="job-item"><h3><a href="/viec-lam/x">x</a></h3></div>', "", 1)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def parse_pool() -> ProcessPoolExecutor:
+    """Return the process-wide parse pool, starting and warming its workers"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = available_cores()
+            # spawn: the pool is shared with threads, where forking is unsafe
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+            # Workers are started on demand; submit one task each so all are warm
+            for future in [pool.submit(available_cores) for _ in range(workers)]:
+                future.result()
+            _pool = pool
+        return _pool
+
+
+def parse_listing(html: bytes, location: str, max_jobs: int, mode: str | None = None) -> list[dict]:
+    """
+    Parse a listing page inline or in the worker pool
+
+    Args:
+        html: Raw listing page HTML
+        location: Location used when a card has none
+        max_jobs: Maximum number of jobs to return
+        mode: "inline" or "process", defaults to ``PARSE_MODE``
+
+    Returns:
+        list of job dictionaries
+    """
+    if (mode or PARSE_MODE) == "process":
+        return parse_pool().submit(parse_topcv_cards, html, location, max_jobs).result()
+    return parse_topcv_cards(html, location, max_jobs)
@@ -0,0 +1,226 @@
+# -------- Upstream Resilience --------
+# Per-upstream circuit breakers, hedged requests and jittered retries used by
+# the job search tools so that one slow job site does not set the latency of
+# every search.
+
+from typing import Awaitable, Callable
+import asyncio
+import random
+import threading
+import time
+
+
+class CircuitOpenError(Exception):
+    """Raised when an upstream is skipped because its circuit is open"""
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the overall deadline is used up before a call succeeds"""
+
+
+def is_upstream_failure(error: Exception) -> bool:
+    """
+    Whether an error says the upstream is unhealthy
+
+    Server errors (5xx), rate limiting (429), timeouts and transport errors
+    count; other HTTP errors (a 404 for an expired posting) are the request's
+    fault and are not worth a retry either.
+    """
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    return status is None or status >= 500 or status == 429
+
+
+class Deadline:
+    """Overall time budget shared by every call made for one tool invocation"""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one upstream
+
+    Consecutive failures (errors or calls slower than ``slow_call_seconds``)
+    open the circuit. After ``reset_timeout`` seconds a single half-open probe
+    is let through; its outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 3,
+                 slow_call_seconds: float = 8.0, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """Return True if a call to the upstream may be attempted now"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # Half-open: only one probe at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self, elapsed: float) -> None:
+        if elapsed > self.slow_call_seconds:
+            self.record_failure()
+            return
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Give up a half-open probe without an outcome, so another may run"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(upstream: str) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for an upstream"""
+    with _breakers_lock:
+        if upstream not in _breakers:
+            _breakers[upstream] = CircuitBreaker(upstream)
+        return _breakers[upstream]
+
+
+async def _async_hedged_call(fn: Callable[[float], Awaitable], timeout: float,
+                             hedge_after: float):
+    """Run ``fn`` and start a duplicate if it has not finished after ``hedge_after``
+
+    The losing attempt is cancelled instead of left running.
+    """
+    started = time.monotonic()
+    pending = {asyncio.ensure_future(fn(timeout))}
+    try:
+        done, pending = await asyncio.wait(pending, timeout=min(hedge_after, timeout))
+        if not done:
+            remaining = timeout - (time.monotonic() - started)
+            if remaining > 0:
+                pending.add(asyncio.ensure_future(fn(remaining)))
+
+        error = None
+        while True:
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+            if not pending:
+                break
+            remaining = timeout - (time.monotonic() - started)
+            if remaining <= 0:
+                break
+            done, pending = await asyncio.wait(pending, timeout=remaining,
+                                               return_when=asyncio.FIRST_COMPLETED)
+        raise error or DeadlineExceeded(f"no response within {timeout:.1f}s")
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def async_call_with_resilience(upstream: str, fn: Callable[[float], Awaitable],
+                                     deadline: Deadline, attempts: int = 3,
+                                     hedge_after: float | None = None,
+                                     base_delay: float = 0.5,
+                                     is_retryable: Callable[[Exception], bool] = lambda e: True):
+    """
+    Call an upstream through its circuit breaker, with retries and hedging
+
+    Args:
+        upstream: Upstream name, one circuit breaker per name
+        fn: Coroutine function taking the timeout (seconds) for a single attempt
+        deadline: Overall deadline for all attempts and backoff sleeps
+        attempts: Maximum number of attempts
+        hedge_after: Start a duplicate request when an attempt is slower than this
+        base_delay: Base of the exponential backoff (full jitter)
+        is_retryable: Decides whether an error is worth another attempt
+
+    Returns:
+        The result of ``fn``
+
+    Raises:
+        CircuitOpenError: The upstream is known to be down
+        DeadlineExceeded: The deadline ran out
+        Exception: The last error raised by ``fn``
+    """
+    breaker = get_breaker(upstream)
+
+    for attempt in range(attempts):
+        timeout = deadline.remaining()
+        if timeout <= 0:
+            raise DeadlineExceeded(f"deadline exceeded before calling {upstream}")
+        if not breaker.allow_request():
+            raise CircuitOpenError(f"{upstream} circuit is {breaker.state}")
+
+        started = time.monotonic()
+        try:
+            if hedge_after is not None:
+                result = await _async_hedged_call(fn, timeout, hedge_after)
+            else:
+                result = await asyncio.wait_for(fn(timeout), timeout)
+        except asyncio.CancelledError:
+            # The session was cancelled, which says nothing about the
+            # upstream: only free a half-open probe slot
+            breaker.release_probe()
+            raise
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                e = DeadlineExceeded(f"no response from {upstream} within {timeout:.1f}s")
+            if not is_upstream_failure(e):
+                # The upstream answered (e.g. 404): not its failure, and not
+                # worth another attempt
+                breaker.release_probe()
+                raise e
+            breaker.record_failure()
+            if attempt == attempts - 1 or not is_retryable(e):
+                raise e
+            # Full jitter, never sleeping past the deadline
+            delay = random.uniform(0, base_delay * (2 ** attempt))
+            if delay >= deadline.remaining():
+                raise e
+            await asyncio.sleep(delay)
+            continue
+
+        breaker.record_success(time.monotonic() - started)
+        return result
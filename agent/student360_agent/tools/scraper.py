@@ -1,35 +1,92 @@
 # -------- Core Tools --------
 
-import requests
-from bs4 import BeautifulSoup
+# bs4 is imported inside the tools that need it so that importing this module
+# (and therefore the agent) stays cheap on cold start. The search tools that
+# do network I/O are the ``async def`` ones in ``async_scraper.py``.
+from typing import TYPE_CHECKING
 from urllib.parse import quote_plus
-import time
-import random
+import functools
 import re
 
-
-def google_search_jobs(query: str, location: str = "", max_results: int = 10) -> list[dict]:
+from student360_agent.tools.gazetteer import (
+    experience_gazetteer, job_type_gazetteer, province_gazetteer, skill_gazetteer)
+from student360_agent.tools.parsing import job_card_markers
+from student360_agent.tools.semantic_index import semantic_similarities
+from student360_agent.tools.seen_jobs import seen_job_store, user_id_from_context
+from student360_agent.tools.session_cache import store_requirements, store_search_results
+
+if TYPE_CHECKING:
+    from google.adk.tools import ToolContext
+
+# Overall time budgets per tool call; slow or failing sources are skipped and
+# reported in ``skipped_sources`` instead of holding up the whole search.
+GOOGLE_SEARCH_DEADLINE_SECONDS = 10.0
+SCRAPE_DEADLINE_SECONDS = 30.0
+# Send a duplicate listing-page request when the first one is this slow
+SCRAPE_HEDGE_AFTER_SECONDS = 3.0
+# Listing pages are streamed and never read past this size
+MAX_LISTING_BYTES = 2 * 1024 * 1024
+STREAM_CHUNK_BYTES = 16 * 1024
+# Score points for a job with no exact skill match that is identical in
+# meaning to the profile (cosine 1.0); at most the points of two exact skills
+SEMANTIC_BONUS_POINTS = 8
+SEMANTIC_REASON_THRESHOLD = 0.25
+
+GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+SCRAPE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "vi-VN,vi;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Cache-Control": "no-cache"
+}
+
+
+class ListingPageReader:
     """
-    Use Google Custom Search API to find job postings from Vietnamese job sites
-
-    Args:
-        query: Job search terms (e.g., "backend developer java")
-        location: Location preference (e.g., "TP.HCM", "Hà Nội")
-        max_results: Maximum number of results to return
+    Accumulate a streamed listing page until enough job cards have arrived
 
-    Returns:
-        list of job dictionaries with basic info from Google search
+    Reading is done once the card after the ``max_jobs``-th one starts (so
+    the last wanted card is complete), or when ``max_bytes`` have been read.
     """
-    import os
 
-    # Get API credentials
-    api_key = os.getenv('GOOGLE_API_KEY')
-    search_engine_id = os.getenv('GOOGLE_CSE_ID')
+    def __init__(self, max_jobs: int, max_bytes: int = MAX_LISTING_BYTES):
+        self.max_jobs = max_jobs
+        self.max_bytes = max_bytes
+        self.body = bytearray()
+        self._markers = job_card_markers()
+        self._scan_from = 0
+        # Counted per marker: a card may carry both of them
+        self._cards_seen = dict.fromkeys(self._markers, 0)
+
+    def feed(self, chunk: bytes) -> bool:
+        """Add a chunk; return True when no more of the page is needed"""
+        body = self.body
+        body.extend(chunk)
+        if len(body) >= self.max_bytes:
+            print(f"Listing page truncated at {self.max_bytes} bytes")
+            del body[self.max_bytes:]
+            return True
+
+        # Re-scan a small overlap so markers split across chunks are found
+        for key, marker in self._markers.items():
+            self._cards_seen[key] += sum(
+                1 for match in marker.finditer(body, max(0, self._scan_from - 64))
+                if match.end() > self._scan_from
+            )
+        self._scan_from = len(body)
+        return max(self._cards_seen.values()) > self.max_jobs
+
+
+def topcv_listing_url(query: str, location: str, page: int) -> str:
+    url = f"https://www.topcv.vn/viec-lam?q={quote_plus(query)}"
+    if location:
+        url += f"&l={quote_plus(location)}"
+    return url + f"&page={page}"
 
-    if not api_key or not search_engine_id:
-        print("Google API credentials not found, using fallback scraping")
-        return []
 
+def build_google_query(query: str, location: str) -> str:
+    """Custom Search query restricted to Vietnamese job sites"""
     # Target Vietnamese job sites
     job_sites = [
         "site:topcv.vn",
@@ -65,179 +122,52 @@ def google_search_jobs(query: str, location: str = "", max_results: int = 10) ->
 
     if vn_alternatives:
         full_query += f" OR ({' '.join(vn_alternatives)})"
+    return full_query
+
+
+def google_search_params(api_key: str, search_engine_id: str, full_query: str,
+                         max_results: int) -> dict:
+    return {
+        'key': api_key,
+        'cx': search_engine_id,
+        'q': full_query,
+        'num': min(max_results, 10),  # API limit per request
+        'lr': 'lang_vi',  # Vietnamese language
+        'gl': 'vn',       # Vietnam country
+        'safe': 'active'
+    }
 
-    try:
-        # Google Custom Search API call
-        url = "https://www.googleapis.com/customsearch/v1"
-        params = {
-            'key': api_key,
-            'cx': search_engine_id,
-            'q': full_query,
-            'num': min(max_results, 10),  # API limit per request
-            'lr': 'lang_vi',  # Vietnamese language
-            'gl': 'vn',       # Vietnam country
-            'safe': 'active'
-        }
-
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-
-        jobs = []
-        for item in data.get('items', []):
-            # Extract job info from Google results
-            title = item.get('title', '')
-            snippet = item.get('snippet', '')
-            url = item.get('link', '')
-
-            # Parse company and other details from snippet and title
-            company = extract_company_from_google_result(title, snippet)
-            salary = extract_salary_from_snippet(snippet)
-            job_location = location if location else extract_location_from_snippet(
-                snippet)
-            source = extract_source_from_url(url)
-
-            jobs.append({
-                'title': clean_job_title(title),
-                'company': company,
-                'location': job_location,
-                'salary': salary,
-                'url': url,
-                'source': source,
-                'snippet': snippet[:200] + "..." if len(snippet) > 200 else snippet
-            })
-
-        return jobs
-
-    except requests.exceptions.RequestException as e:
-        print(f"Google API request error: {e}")
-        return []
-    except Exception as e:
-        print(f"Google search error: {e}")
-        return []
-
-
-def web_scrape_jobs(query: str, location: str = "", pages: int = 1) -> list[dict]:
-    """
-    Enhanced web scraping for job sites with better reliability
-
-    Args:
-        query: Search query
-        location: Location filter
-        pages: Number of pages to scrape
 
-    Returns:
-        list of detailed job dictionaries
-    """
+def jobs_from_google_results(data: dict, location: str) -> list[dict]:
+    """Turn a Custom Search API response into job dictionaries"""
+    jobs = []
+    for item in data.get('items', []):
+        # Extract job info from Google results
+        title = item.get('title', '')
+        snippet = item.get('snippet', '')
+        url = item.get('link', '')
+
+        # Parse company and other details from snippet and title
+        company = extract_company_from_google_result(title, snippet)
+        salary = extract_salary_from_snippet(snippet)
+        job_location = location if location else extract_location_from_snippet(
+            snippet)
+        source = extract_source_from_url(url)
+
+        jobs.append({
+            'title': clean_job_title(title),
+            'company': company,
+            'location': job_location,
+            'salary': salary,
+            'url': url,
+            'source': source,
+            'snippet': snippet[:200] + "..." if len(snippet) > 200 else snippet
+        })
+    return jobs
 
-    def scrape_topcv(query: str, location: str, page: int) -> list[dict]:
-        """Scrape TopCV with improved selectors"""
-        try:
-            url = f"https://www.topcv.vn/viec-lam?q={quote_plus(query)}"
-            if location:
-                url += f"&l={quote_plus(location)}"
-            url += f"&page={page}"
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "vi-VN,vi;q=0.9,en;q=0.8",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Cache-Control": "no-cache"
-            }
-
-            response = requests.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            jobs = []
-
-            # Multiple selector strategies for robustness
-            job_selectors = [
-                "[data-cy='job-card']",
-                ".job-item",
-                ".job-list-search-result .job-item",
-                ".search-result .job-item"
-            ]
-
-            for selector in job_selectors:
-                cards = soup.select(selector)
-                if cards:
-                    break
-
-            for card in cards:
-                # Try multiple title selectors
-                title_el = None
-                title_selectors = ["a[href*='/viec-lam/']",
-                                   ".title a", "h3 a", ".job-title a"]
-                for sel in title_selectors:
-                    title_el = card.select_one(sel)
-                    if title_el:
-                        break
-
-                if not title_el:
-                    continue
-
-                # Extract other info with fallbacks
-                company_el = card.select_one(
-                    ".company, .job-company, [data-cy='company-name'], .company-name")
-                loc_el = card.select_one(
-                    ".address, .location, [data-cy='job-location'], .job-location")
-                salary_el = card.select_one(
-                    ".salary, [data-cy='job-salary'], .job-salary")
-
-                url = title_el.get("href", "")
-                if url and url.startswith("/"):
-                    url = "https://www.topcv.vn" + url
-
-                jobs.append({
-                    'title': title_el.get_text(strip=True),
-                    'company': company_el.get_text(strip=True) if company_el else "",
-                    'location': loc_el.get_text(strip=True) if loc_el else location,
-                    'salary': salary_el.get_text(strip=True) if salary_el else "Thỏa thuận",
-                    'url': url,
-                    'source': 'topcv'
-                })
-
-            return jobs
-
-        except Exception as e:
-            print(f"Error scraping TopCV: {e}")
-            return []
-
-    def scrape_vietnamworks(query: str, location: str, page: int) -> list[dict]:
-        """Scrape VietnamWorks with enhanced error handling"""
-        try:
-            # Similar implementation with multiple selector fallbacks
-            # and better error handling
-            pass
-        except Exception as e:
-            print(f"Error scraping VietnamWorks: {e}")
-            return []
-
-    def scrape_topdev(query: str, location: str, page: int) -> list[dict]:
-        """Scrape TopDev for tech jobs"""
-        try:
-            # Implementation for TopDev
-            pass
-        except Exception as e:
-            print(f"Error scraping TopDev: {e}")
-            return []
-
-    # Execute scraping across sites
-    all_jobs = []
-    scrapers = [scrape_topcv, scrape_vietnamworks, scrape_topdev]
-
-    for scraper in scrapers:
-        for page in range(1, pages + 1):
-            try:
-                jobs = scraper(query, location, page)
-                all_jobs.extend(jobs)
-                time.sleep(random.uniform(1, 2))  # Rate limiting
-            except Exception as e:
-                print(f"Scraper error: {e}")
-                continue
 
+def scrape_result(all_jobs: list[dict], skipped_sources: list[str]) -> dict:
+    """Deduplicate scraped jobs by URL and report skipped sources"""
     # Remove duplicates
     seen_urls = set()
     unique_jobs = []
@@ -246,7 +176,11 @@ def web_scrape_jobs(query: str, location: str = "", pages: int = 1) -> list[dict
             seen_urls.add(job['url'])
             unique_jobs.append(job)
 
-    return unique_jobs
+    return {
+        'jobs': unique_jobs,
+        'skipped_sources': skipped_sources,
+        'partial': bool(skipped_sources)
+    }
 
 
 def optimize_search_query(user_request: str, user_profile: dict) -> list[str]:
@@ -306,13 +240,19 @@ def optimize_search_query(user_request: str, user_profile: dict) -> list[str]:
     return unique_queries[:5]  # Top 5 queries
 
 
-def merge_and_deduplicate_jobs(google_jobs: list[dict], scraped_jobs: list[dict]) -> list[dict]:
+def merge_and_deduplicate_jobs(google_jobs: list[dict], scraped_jobs: list[dict],
+                               new_only: bool = False,
+                               tool_context: "ToolContext | None" = None) -> list[dict]:
     """
     Merge results from Google search and scraping, remove duplicates
 
+    Each job gets a 'seen' flag telling whether the user was already shown it
+    in an earlier search.
+
     Args:
         google_jobs: Jobs found via Google search
         scraped_jobs: Jobs found via web scraping
+        new_only: Drop jobs the user has already seen ("chỉ việc mới")
 
     Returns:
         Merged and deduplicated job list
@@ -343,10 +283,19 @@ def merge_and_deduplicate_jobs(google_jobs: list[dict], scraped_jobs: list[dict]
             seen_titles_companies.add(title_company_key)
             all_jobs.append(job)
 
+    user_id = user_id_from_context(tool_context)
+    if user_id:
+        flags = seen_job_store().seen_flags(user_id, all_jobs)
+        # New dicts: the caller's job lists are left untouched
+        all_jobs = [{**job, 'seen': seen} for job, seen in zip(all_jobs, flags)]
+        if new_only:
+            all_jobs = [job for job in all_jobs if not job['seen']]
+
     return all_jobs
 
 
-def analyze_and_score_jobs(jobs: list[dict], user_profile: dict) -> list[dict]:
+def analyze_and_score_jobs(jobs: list[dict], user_profile: dict,
+                           tool_context: "ToolContext | None" = None) -> list[dict]:
     """
     Analyze and score jobs based on user profile
 
@@ -363,8 +312,10 @@ def analyze_and_score_jobs(jobs: list[dict], user_profile: dict) -> list[dict]:
     user_location = user_profile.get('location', '').lower()
     user_experience = user_profile.get('experience_years', 0)
     expected_salary = user_profile.get('expected_salary', 0)
+    # Catches related skills that exact matching misses (Spring Boot ~ Java backend)
+    similarities = semantic_similarities(jobs, user_profile)
 
-    for job in jobs:
+    for job, similarity in zip(jobs, similarities):
         score = 0
         reasons = []
 
@@ -373,10 +324,13 @@ def analyze_and_score_jobs(jobs: list[dict], user_profile: dict) -> list[dict]:
         location = job.get('location', '').lower()
         salary = job.get('salary', '').lower()
 
+        # Enriched jobs carry the full description next to the snippet
+        details = (job.get('snippet', '') + ' ' + job.get('description', '')).lower()
+
         # Skill matching (highest weight)
         skill_matches = 0
         for skill in user_skills:
-            if skill in title or skill in job.get('snippet', '').lower():
+            if skill in title or skill in details:
                 score += 5
                 skill_matches += 1
                 reasons.append(f"Khớp skill {skill.title()}")
@@ -386,6 +340,13 @@ def analyze_and_score_jobs(jobs: list[dict], user_profile: dict) -> list[dict]:
             score += 3
             reasons.append("Khớp nhiều skills quan trọng")
 
+        # Semantic similarity stands in for exact skill matches instead of
+        # stacking on them, so match_percentage keeps its scale
+        if not skill_matches:
+            score += round(SEMANTIC_BONUS_POINTS * similarity)
+            if similarity >= SEMANTIC_REASON_THRESHOLD:
+                reasons.append(f"Liên quan đến kỹ năng của bạn ({similarity:.0%})")
+
         # Experience level matching
         if user_experience <= 1:
             if any(term in title for term in ['junior', 'fresher', 'intern', 'trainee']):
@@ -435,13 +396,52 @@ def analyze_and_score_jobs(jobs: list[dict], user_profile: dict) -> list[dict]:
 
     # Sort by score
     scored_jobs.sort(key=lambda x: x['score'], reverse=True)
+    # Keep the ranking for follow-up refinements (see refine_job_results)
+    store_search_results(tool_context, scored_jobs)
     return scored_jobs
 
 
-def format_job_results(scored_jobs: list[dict], search_summary: dict) -> str:
+def rerank_with_descriptions(scored_jobs: list[dict], descriptions: dict[str, str],
+                             user_profile: dict, top_k: int) -> list[dict]:
+    """
+    Re-score the top-k jobs with their full descriptions and re-rank all jobs
+
+    Args:
+        scored_jobs: Ranked output of analyze_and_score_jobs
+        descriptions: Full descriptions keyed by job URL
+        user_profile: User profile with preferences
+        top_k: Number of top jobs the descriptions were fetched for
+
+    Returns:
+        Re-ranked list of jobs with scores and reasoning
+    """
+    top, rest = scored_jobs[:top_k], scored_jobs[top_k:]
+    enriched = []
+    for item in top:
+        job = item['job']
+        description = descriptions.get(job.get('url', ''))
+        if not description:
+            enriched.append(item)
+            continue
+        rescored = analyze_and_score_jobs([{**job, 'description': description}], user_profile)[0]
+        # Keep the description out of the result, it only feeds the scoring
+        rescored['job'] = {**job, 'enriched': True}
+        if not job.get('snippet'):
+            rescored['job']['snippet'] = description[:200] + "..." if len(description) > 200 else description
+        enriched.append(rescored)
+
+    ranked = enriched + rest
+    ranked.sort(key=lambda x: x['score'], reverse=True)
+    return ranked
+
+
+def format_job_results(scored_jobs: list[dict], search_summary: dict,
+                       tool_context: "ToolContext | None" = None) -> str:
     """
     Format final job recommendations in Vietnamese-friendly markdown
 
+    The jobs shown are remembered as seen for the user's next searches.
+
     Args:
         scored_jobs: Jobs with scores and reasons
         search_summary: Summary of search process
@@ -467,6 +467,10 @@ def format_job_results(scored_jobs: list[dict], search_summary: dict) -> str:
 
     top_jobs = scored_jobs[:5]  # Top 5
 
+    user_id = user_id_from_context(tool_context)
+    if user_id:
+        seen_job_store().mark_seen(user_id, [job_data['job'] for job_data in top_jobs])
+
     for i, job_data in enumerate(top_jobs, 1):
         job = job_data['job']
         score = job_data['score']
@@ -528,7 +532,8 @@ def format_job_results(scored_jobs: list[dict], search_summary: dict) -> str:
     return result
 
 
-def extract_user_requirements(user_input: str) -> dict:
+def extract_user_requirements(user_input: str,
+                              tool_context: "ToolContext | None" = None) -> dict:
     """
     Extract job requirements from natural language input
 
@@ -546,40 +551,28 @@ def extract_user_requirements(user_input: str) -> dict:
         'job_type': 'full-time'
     }
 
-    # Common Vietnamese location names
-    vn_locations = {
-        'hồ chí minh': 'TP.HCM', 'ho chi minh': 'TP.HCM', 'saigon': 'TP.HCM',
-        'hà nội': 'Hà Nội', 'hanoi': 'Hà Nội',
-        'đà nẵng': 'Đà Nẵng', 'da nang': 'Đà Nẵng'
-    }
-
-    # Extract locations
-    for location_key, standard_name in vn_locations.items():
-        if location_key in user_input.lower():
-            requirements['location_hints'].append(standard_name)
+    # Gazetteers match on folded tokens, so "Hà Nội", "ha noi" and "HN" are
+    # the same location and "thuc tap" is the same as "thực tập"
+    requirements['location_hints'] = province_gazetteer().values(user_input)
 
-    # Extract experience level
-    if any(term in user_input.lower() for term in ['intern', 'thực tập', 'fresher']):
-        requirements['experience_keywords'].append('intern')
-    elif any(term in user_input.lower() for term in ['junior', 'mới ra trường']):
-        requirements['experience_keywords'].append('junior')
-    elif any(term in user_input.lower() for term in ['senior', 'kinh nghiệm']):
-        requirements['experience_keywords'].append('senior')
+    # Extract experience level (the most junior level mentioned wins)
+    levels = experience_gazetteer().values(user_input)
+    for level in ['intern', 'junior', 'senior']:
+        if level in levels:
+            requirements['experience_keywords'].append(level)
+            break
 
     # Extract job type
-    if any(term in user_input.lower() for term in ['part-time', 'bán thời gian']):
-        requirements['job_type'] = 'part-time'
-    elif any(term in user_input.lower() for term in ['internship', 'thực tập']):
-        requirements['job_type'] = 'internship'
-
-    # Extract technical skills
-    tech_skills = ['java', 'python', 'javascript', 'react', 'vue', 'angular',
-                   'node.js', 'spring', 'spring boot', 'mysql', 'postgresql']
+    job_types = job_type_gazetteer().values(user_input)
+    for job_type in ['part-time', 'internship']:
+        if job_type in job_types:
+            requirements['job_type'] = job_type
+            break
 
-    for skill in tech_skills:
-        if skill in user_input.lower():
-            requirements['skills'].append(skill)
+    # Extract skills (canonical names from the skill taxonomy)
+    requirements['skills'] = skill_gazetteer().values(user_input)
 
+    store_requirements(tool_context, requirements)
     return requirements
 
 # -------- Helper Functions for Google Search --------
@@ -608,21 +601,30 @@ def extract_company_from_google_result(title: str, snippet: str) -> str:
     return "N/A"
 
 
-def extract_salary_from_snippet(snippet: str) -> str:
-    """Extract salary from snippet text"""
-    import re
-
+@functools.lru_cache(maxsize=None)
+def _salary_patterns() -> tuple:
+    """Compile the salary regex table on first use"""
     # Vietnamese salary patterns
-    salary_patterns = [
+    return tuple(re.compile(pattern) for pattern in [
         r'(\d+)-(\d+)\s*(triệu|tr|million)',  # 15-25 triệu
         r'(\d+)\s*(triệu|tr|million)',         # 20 triệu
         r'(\d+,?\d*)\s*-\s*(\d+,?\d*)\s*VND',  # 15,000,000 - 25,000,000 VND
         r'lương:\s*([^.]+)',                   # lương: 15-25 triệu
         r'salary:\s*([^.]+)'                   # salary: $1000-2000
-    ]
+    ])
+
+
+@functools.lru_cache(maxsize=None)
+def _title_suffix_pattern() -> re.Pattern:
+    """Compile the job-site suffix regex on first use"""
+    return re.compile(r'\s*-\s*(TopCV|VietnamWorks|TopDev|ITviec|CareerBuilder).*',
+                      flags=re.IGNORECASE)
+
 
-    for pattern in salary_patterns:
-        match = re.search(pattern, snippet.lower())
+def extract_salary_from_snippet(snippet: str) -> str:
+    """Extract salary from snippet text"""
+    for pattern in _salary_patterns():
+        match = pattern.search(snippet.lower())
         if match:
             return match.group(0).strip()
 
@@ -635,15 +637,8 @@ def extract_salary_from_snippet(snippet: str) -> str:
 
 def extract_location_from_snippet(snippet: str) -> str:
     """Extract location from snippet if not provided"""
-    vn_locations = ['tp.hcm', 'hồ chí minh',
-                    'hà nội', 'đà nẵng', 'cần thơ', 'hải phòng']
-
-    snippet_lower = snippet.lower()
-    for location in vn_locations:
-        if location in snippet_lower:
-            return location.title()
-
-    return "N/A"
+    locations = province_gazetteer().values(snippet)
+    return locations[0] if locations else "N/A"
 
 
 def extract_source_from_url(url: str) -> str:
@@ -659,6 +654,5 @@ def extract_source_from_url(url: str) -> str:
 def clean_job_title(title: str) -> str:
     """Clean job title from Google results"""
     # Remove site names and extra info
-    title = re.sub(r'\s*-\s*(TopCV|VietnamWorks|TopDev|ITviec|CareerBuilder).*',
-                   '', title, flags=re.IGNORECASE)
+    title = _title_suffix_pattern().sub('', title)
     return title.strip()
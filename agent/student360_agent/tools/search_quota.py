@@ -0,0 +1,165 @@
+# -------- Custom Search Quota --------
+# Replica-wide coalescing of identical Custom Search requests, a daily quota
+# scheduler that keeps headroom for interactive requests, and a result cache
+# used to degrade gracefully once the budget is nearly gone.
+#
+# Quota usage is counted in memory on each replica, while Google enforces the
+# daily quota per project. Each replica therefore only schedules its share of
+# the project quota (STUDENT360_REPLICAS); with autoscaling that share is
+# approximate, and a "per day" 429 from the API still marks it as used up.
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+import asyncio
+import os
+import threading
+import time
+
+# Custom Search API free tier; set GOOGLE_CSE_DAILY_QUOTA for paid projects
+DAILY_QUOTA = int(os.getenv("GOOGLE_CSE_DAILY_QUOTA", "100"))
+# Replicas sharing the project quota; each one schedules an equal share
+REPLICAS = max(1, int(os.getenv("STUDENT360_REPLICAS", "1")))
+# Share of the daily quota that background work may never use
+INTERACTIVE_RESERVE = 0.2
+# Below this share interactive requests also degrade to cached/scraped results
+DEGRADE_THRESHOLD = 0.05
+
+# Results younger than this are served without calling the API at all;
+# older ones (up to the stale TTL) only once the quota is nearly gone.
+FRESH_RESULT_TTL_SECONDS = 10 * 60
+STALE_RESULT_TTL_SECONDS = 24 * 60 * 60
+RESULT_CACHE_SIZE = 1024
+
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+
+
+class QuotaExhausted(Exception):
+    """Raised when the remaining Custom Search quota is reserved or used up"""
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent calls with the same key (on one event loop) into one upstream call"""
+
+    def __init__(self):
+        self._calls: dict[tuple[int, str], asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable]):
+        """
+        Await ``fn()`` once for all concurrent callers of ``key``
+
+        Returns:
+            The result of ``fn``; waiters share the leader's result or error
+        """
+        loop = asyncio.get_running_loop()
+        # Tasks belong to one loop, so calls are only shared within a loop
+        call_key = (id(loop), key)
+        task = self._calls.get(call_key)
+        if task is None:
+            task = self._calls[call_key] = loop.create_task(fn())
+            task.add_done_callback(lambda _: self._calls.pop(call_key, None))
+        # A cancelled caller, even the first one, must not cancel the shared call
+        return await asyncio.shield(task)
+
+
+def _quota_day() -> str:
+    """Custom Search quotas reset at midnight Pacific time"""
+    try:
+        from zoneinfo import ZoneInfo
+        return datetime.now(ZoneInfo("America/Los_Angeles")).date().isoformat()
+    except Exception:
+        # No tz database available: approximate with UTC-8
+        return datetime.fromtimestamp(time.time() - 8 * 3600, timezone.utc).date().isoformat()
+
+
+class QuotaScheduler:
+    """Track this replica's daily Custom Search allowance and admit calls by priority"""
+
+    def __init__(self, daily_quota: int = DAILY_QUOTA // REPLICAS,
+                 interactive_reserve: float = INTERACTIVE_RESERVE,
+                 degrade_threshold: float = DEGRADE_THRESHOLD):
+        self.daily_quota = daily_quota
+        self.interactive_reserve = interactive_reserve
+        self.degrade_threshold = degrade_threshold
+        self._day = _quota_day()
+        self._used = 0
+        self._lock = threading.Lock()
+
+    def _roll_over(self) -> None:
+        day = _quota_day()
+        if day != self._day:
+            self._day = day
+            self._used = 0
+
+    def remaining(self) -> int:
+        with self._lock:
+            self._roll_over()
+            return max(0, self.daily_quota - self._used)
+
+    def admit(self, priority: str = INTERACTIVE) -> None:
+        """
+        Admit a call of the given priority and count it, in one step
+
+        Checking and counting under one lock keeps concurrent callers from
+        all passing the check before any of them is counted.
+
+        Raises:
+            QuotaExhausted: The call should be served from cache or scraping
+        """
+        floor = self.degrade_threshold if priority == INTERACTIVE else self.interactive_reserve
+        with self._lock:
+            self._roll_over()
+            remaining = max(0, self.daily_quota - self._used)
+            if remaining <= self.daily_quota * floor:
+                raise QuotaExhausted(
+                    f"{remaining}/{self.daily_quota} Custom Search queries left, "
+                    f"not enough for {priority} requests")
+            self._used += 1
+
+    def record_call(self) -> None:
+        """Count an extra API request of an admitted call (every retry is billed)"""
+        with self._lock:
+            self._roll_over()
+            self._used += 1
+
+    def mark_exhausted(self) -> None:
+        """The API reported the daily limit as reached"""
+        with self._lock:
+            self._roll_over()
+            self._used = max(self._used, self.daily_quota)
+
+
+class SearchResultCache:
+    """Thread-safe LRU cache of search results with age-based lookups"""
+
+    def __init__(self, max_entries: int = RESULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, max_age: float):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > max_age:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, value) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def search_key(query: str, location: str, max_results: int) -> str:
+    """Normalize a search so equivalent requests share one call and cache entry"""
+    return "|".join([" ".join(query.lower().split()), " ".join(location.lower().split()),
+                     str(max_results)])
+
+
+cse_async_flight = AsyncSingleFlight()
+cse_quota = QuotaScheduler()
+cse_results = SearchResultCache()
@@ -0,0 +1,245 @@
+# -------- Seen Job Store --------
+# Per-user Bloom filters over job fingerprints, so repeated searches can mark
+# or drop postings a student has already been shown, and digests can send only
+# new jobs, without keeping a job history per student. A user's filters take a
+# few dozen KiB on disk and in memory no matter how many jobs they have seen.
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import functools
+import hashlib
+import math
+import os
+import struct
+import tempfile
+import threading
+
+from student360_agent.tools.gazetteer import fold_text
+
+if TYPE_CHECKING:
+    from google.adk.tools import ToolContext
+
+# Jobs per filter generation; once full, the older generation is dropped, so a
+# user remembers between SEEN_CAPACITY and 2 * SEEN_CAPACITY recent jobs.
+SEEN_CAPACITY = 5000
+# A job adds up to two fingerprints (URL and title + company), and filters
+# are sized and counted in fingerprints
+FINGERPRINTS_PER_JOB = 2
+SEEN_ERROR_RATE = 0.01
+# Users whose filters are kept in memory at once (about 24 KiB each)
+MAX_LOADED_USERS = 1024
+DEFAULT_SEEN_DIR = os.path.join(os.path.expanduser("~"), ".cache", "student360", "seen_jobs")
+
+# Query parameters that only track where a click came from (plus utm_*)
+TRACKING_PARAMS = {"ta_source", "ref", "src", "gclid", "fbclid"}
+
+_FILE_MAGIC = b"S360BF1\n"
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a job URL so the same posting reached via different links matches"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    query = [(key, value) for key, value in parse_qsl(parts.query)
+             if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS]
+    return urlunsplit(("https", host, parts.path.rstrip("/"), urlencode(sorted(query)), ""))
+
+
+def job_fingerprints(job: dict) -> list[bytes]:
+    """
+    Fingerprints of a job: its canonical URL and its folded title + company
+
+    A job counts as seen if any of its fingerprints was seen, so a posting
+    found on Google and on the job site itself is recognized either way.
+    """
+    keys = []
+    url = job.get('url') or ''
+    if url.startswith("http"):
+        keys.append("url:" + canonical_url(url))
+    title = " ".join(fold_text(job.get('title') or '').split())
+    company = " ".join(fold_text(job.get('company') or '').split())
+    if title and company and company != "n/a":
+        keys.append(f"job:{title}|{company}")
+    return [hashlib.blake2b(key.encode(), digest_size=16).digest() for key in keys]
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 128-bit fingerprints (double hashing)"""
+
+    def __init__(self, capacity: int = SEEN_CAPACITY * FINGERPRINTS_PER_JOB, error_rate: float = SEEN_ERROR_RATE,
+                 bits: bytearray | None = None, count: int = 0):
+        self.capacity = capacity
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.num_bits + 7) // 8)
+        self.count = count
+
+    def _positions(self, fingerprint: bytes):
+        h1, h2 = struct.unpack("<QQ", fingerprint)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def __contains__(self, fingerprint: bytes) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fingerprint))
+
+    def add(self, fingerprint: bytes) -> bool:
+        """Add a fingerprint; return False if it was (probably) already present"""
+        added = False
+        for pos in self._positions(fingerprint):
+            mask = 1 << (pos & 7)
+            if not self.bits[pos >> 3] & mask:
+                self.bits[pos >> 3] |= mask
+                added = True
+        self.count += added
+        return added
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class UserSeenJobs:
+    """Two filter generations for one user; lookups check both"""
+
+    def __init__(self, current: BloomFilter | None = None, previous: BloomFilter | None = None):
+        self.current = current or BloomFilter()
+        self.previous = previous
+
+    def seen(self, fingerprints: list[bytes]) -> bool:
+        return any(fp in self.current or (self.previous is not None and fp in self.previous)
+                   for fp in fingerprints)
+
+    def add(self, fingerprints: list[bytes]) -> bool:
+        added = False
+        for fp in fingerprints:
+            added |= self.current.add(fp)
+        if self.current.full:
+            # Forget the oldest generation instead of letting the error rate grow
+            self.previous, self.current = self.current, BloomFilter(
+                self.current.capacity)
+        return added
+
+    def to_bytes(self) -> bytes:
+        filters = [f for f in (self.current, self.previous) if f is not None]
+        header = struct.pack("<IB", self.current.capacity, len(filters))
+        body = b"".join(struct.pack("<I", f.count) + bytes(f.bits) for f in filters)
+        return _FILE_MAGIC + header + body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "UserSeenJobs":
+        if not data.startswith(_FILE_MAGIC):
+            raise ValueError("not a seen-jobs file")
+        capacity, generations = struct.unpack_from("<IB", data, len(_FILE_MAGIC))
+        offset = len(_FILE_MAGIC) + 5
+        filters = []
+        for _ in range(generations):
+            (count,) = struct.unpack_from("<I", data, offset)
+            bloom = BloomFilter(capacity, count=count)
+            size = len(bloom.bits)
+            bloom.bits = bytearray(data[offset + 4:offset + 4 + size])
+            if len(bloom.bits) != size:
+                raise ValueError("truncated seen-jobs file")
+            filters.append(bloom)
+            offset += 4 + size
+        return cls(*filters)
+
+
+class SeenJobStore:
+    """
+    Per-user seen-job filters persisted as one small file per user
+
+    Filters are loaded on demand and kept in an LRU of ``max_loaded_users``
+    entries; every change is written through, so evicting needs no flush.
+    """
+
+    def __init__(self, directory: str, max_loaded_users: int = MAX_LOADED_USERS):
+        self.directory = directory
+        self.max_loaded_users = max_loaded_users
+        self._loaded: OrderedDict[str, UserSeenJobs] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, user_id: str) -> str:
+        name = hashlib.sha256(user_id.encode()).hexdigest()[:32]
+        return os.path.join(self.directory, f"{name}.bloom")
+
+    def _user(self, user_id: str) -> UserSeenJobs:
+        user = self._loaded.get(user_id)
+        if user is not None:
+            self._loaded.move_to_end(user_id)
+            return user
+
+        user = UserSeenJobs()
+        try:
+            with open(self._path(user_id), "rb") as f:
+                user = UserSeenJobs.from_bytes(f.read())
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Ignoring unreadable seen-jobs file for user: {e}")
+
+        self._loaded[user_id] = user
+        while len(self._loaded) > self.max_loaded_users:
+            self._loaded.popitem(last=False)
+        return user
+
+    def _save(self, user_id: str, user: UserSeenJobs) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write then rename, so a crash never leaves a half-written filter
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(user.to_bytes())
+            os.replace(tmp_path, self._path(user_id))
+        except OSError as e:
+            print(f"Could not save seen jobs: {e}")
+
+    def seen_flags(self, user_id: str, jobs: list[dict]) -> list[bool]:
+        """Return for each job whether the user has (probably) seen it"""
+        with self._lock:
+            user = self._user(user_id)
+            return [user.seen(job_fingerprints(job)) for job in jobs]
+
+    def mark_seen(self, user_id: str, jobs: Iterable[dict]) -> None:
+        """Remember that the user has been shown these jobs"""
+        with self._lock:
+            user = self._user(user_id)
+            changed = False
+            for job in jobs:
+                changed |= user.add(job_fingerprints(job))
+            if changed:
+                self._save(user_id, user)
+
+
+@functools.lru_cache(maxsize=None)
+def seen_job_store() -> SeenJobStore:
+    """Process-wide store under $STUDENT360_SEEN_DIR (default ~/.cache/student360)"""
+    return SeenJobStore(os.getenv("STUDENT360_SEEN_DIR") or DEFAULT_SEEN_DIR)
+
+
+def user_id_from_context(tool_context: "ToolContext | None") -> str | None:
+    """User id of the session a tool runs in, if any"""
+    if tool_context is None:
+        return None
+    # ADK 1.x exposes the user id only through the invocation context
+    invocation_context = getattr(tool_context, "_invocation_context", None)
+    return getattr(invocation_context, "user_id", None) or None
+
+
+def filter_new_jobs(user_id: str, jobs: list[dict], mark: bool = True) -> list[dict]:
+    """
+    Keep only the jobs a user has not seen yet, e.g. for digest notifications
+
+    Args:
+        user_id: User the digest is for
+        jobs: Candidate jobs
+        mark: Record the returned jobs as seen
+
+    Returns:
+        The unseen jobs, in their original order
+    """
+    store = seen_job_store()
+    new_jobs = [job for job, seen in zip(jobs, store.seen_flags(user_id, jobs)) if not seen]
+    if mark and new_jobs:
+        store.mark_seen(user_id, new_jobs)
+    return new_jobs
@@ -0,0 +1,331 @@
+# -------- Semantic Job Index --------
+# Offline embeddings for jobs and profiles, and an approximate nearest
+# neighbour index over them. Text is embedded with a hashing vectorizer whose
+# features include taxonomy skills, their languages and their categories, so
+# "Spring Boot" and "Java backend" share features even without a common word.
+# No model or network is needed, and the same text always gets the same vector.
+#
+# numpy is only needed for the index; scoring a handful of jobs against a
+# profile uses the sparse vectors directly.
+
+from typing import TYPE_CHECKING
+import asyncio
+import functools
+import hashlib
+import json
+import math
+import os
+import tempfile
+
+from student360_agent.tools.gazetteer import (
+    category_gazetteer, skill_gazetteer, skill_relations, skill_taxonomy, tokenize)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+VECTOR_DIM = 256
+TOKEN_WEIGHT = 0.5
+SKILL_WEIGHT = 2.0
+LANGUAGE_WEIGHT = 1.5
+CATEGORY_WEIGHT = 1.0
+
+# Inverted-file index: jobs are grouped under their nearest of ~sqrt(n)
+# centroids and a query only scans the lists of its nprobe nearest centroids.
+DEFAULT_NPROBE = 32
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_SIZE = 20_000
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".cache", "student360", "job_index.npz")
+
+# Words that say nothing about the job itself
+STOP_WORDS = {
+    "a", "an", "and", "at", "for", "in", "of", "on", "or", "the", "to", "with",
+    "cho", "cua", "cong", "ty", "la", "lam", "nhan", "tai", "tuyen", "dung", "va", "viec", "voi",
+}
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _hash_feature(feature: str) -> tuple[int, float]:
+    digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+    # Signed hashing: collisions cancel out on average instead of adding up
+    return digest % VECTOR_DIM, 1.0 if digest >> 63 else -1.0
+
+
+def text_features(text: str) -> dict[str, float]:
+    """Weighted features of a job or profile text"""
+    features: dict[str, float] = {}
+    for token in tokenize(text):
+        if len(token) > 1 and token not in STOP_WORDS:
+            features["w:" + token] = features.get("w:" + token, 0.0) + 1.0
+    # Sublinear term frequency, so a repeated word does not dominate
+    features = {feature: TOKEN_WEIGHT * (1 + math.log(count)) for feature, count in features.items()}
+
+    taxonomy = skill_taxonomy()
+    relations = skill_relations()
+    for skill in skill_gazetteer().values(text):
+        category = taxonomy[skill]
+        features["skill:" + skill] = SKILL_WEIGHT
+        features["cat:" + category] = CATEGORY_WEIGHT
+        languages = [skill] if category == "programming_language" else relations.get(skill, [])
+        for language in languages:
+            features["lang:" + language] = LANGUAGE_WEIGHT
+    for category in category_gazetteer().values(text):
+        features["cat:" + category] = CATEGORY_WEIGHT
+    return features
+
+
+def embed_text(text: str) -> dict[int, float]:
+    """L2-normalized sparse vector (dimension -> value) of a text"""
+    vector: dict[int, float] = {}
+    for feature, weight in text_features(text).items():
+        index, sign = _hash_feature(feature)
+        vector[index] = vector.get(index, 0.0) + sign * weight
+    norm = math.sqrt(sum(value * value for value in vector.values()))
+    return {index: value / norm for index, value in vector.items()} if norm else {}
+
+
+def job_text(job: dict) -> str:
+    parts = [job.get('title') or '', job.get('snippet') or '', job.get('description') or '']
+    parts.extend(job.get('skills') or [])
+    return " ".join(parts)
+
+
+def profile_text(user_profile: dict) -> str:
+    """Skills plus any free-text preferences of a profile (location excluded)"""
+    parts = []
+    for key, value in user_profile.items():
+        if key == 'location':
+            continue
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, list):
+            parts.extend(str(item) for item in value)
+    return " ".join(parts)
+
+
+def semantic_similarities(jobs: list[dict], user_profile: dict) -> list[float]:
+    """Cosine similarity of each job to the profile, in [0, 1]"""
+    profile = embed_text(profile_text(user_profile))
+    if not profile:
+        return [0.0] * len(jobs)
+    similarities = []
+    for job in jobs:
+        vector = embed_text(job_text(job))
+        dot = sum(value * profile.get(index, 0.0) for index, value in vector.items())
+        similarities.append(max(0.0, dot))
+    return similarities
+
+
+def dense_vectors(texts: list[str]) -> "np.ndarray":
+    """Embed texts into a (len(texts), VECTOR_DIM) float32 matrix"""
+    import numpy as np
+
+    matrix = np.zeros((len(texts), VECTOR_DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for index, value in embed_text(text).items():
+            matrix[row, index] = value
+    return matrix
+
+
+def _spherical_kmeans(vectors: "np.ndarray", clusters: int, iterations: int,
+                      rng) -> "np.ndarray":
+    import numpy as np
+
+    centroids = vectors[rng.choice(len(vectors), clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _nearest_centroids(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, vectors)
+        norms = np.linalg.norm(sums, axis=1)
+        empty = norms == 0
+        # Re-seed empty clusters with random vectors
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        norms[empty] = 1.0
+        centroids = sums / norms[:, None]
+    return centroids.astype(np.float32)
+
+
+def _nearest_centroids(vectors: "np.ndarray", centroids: "np.ndarray",
+                       batch_size: int = 8192) -> "np.ndarray":
+    import numpy as np
+
+    assignment = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), batch_size):
+        batch = vectors[start:start + batch_size].astype(np.float32)
+        assignment[start:start + batch_size] = np.argmax(batch @ centroids.T, axis=1)
+    return assignment
+
+
+class JobVectorIndex:
+    """
+    Inverted-file (IVF) index of job vectors, stored with the jobs it indexes
+
+    Vectors are kept as float16 and grouped by list, so a probe reads one
+    contiguous slice per list.
+    """
+
+    def __init__(self, centroids: "np.ndarray", vectors: "np.ndarray",
+                 offsets: "np.ndarray", ids: "np.ndarray", jobs: list[dict]):
+        self.centroids = centroids
+        self.vectors = vectors
+        self.offsets = offsets
+        self.ids = ids
+        self.jobs = jobs
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the index arrays (the job dicts not included)"""
+        return sum(array.nbytes for array in (self.centroids, self.vectors, self.offsets, self.ids))
+
+    @classmethod
+    def build(cls, jobs: list[dict], vectors: "np.ndarray | None" = None,
+              lists: int | None = None, seed: int = 0) -> "JobVectorIndex":
+        """
+        Build an index over jobs
+
+        Args:
+            jobs: Job dictionaries
+            vectors: Precomputed ``dense_vectors`` of the jobs, if any
+            lists: Number of inverted lists (default about sqrt(len(jobs)))
+            seed: Seed for the k-means initialization
+        """
+        import numpy as np
+
+        if vectors is None:
+            vectors = dense_vectors([job_text(job) for job in jobs])
+        rng = np.random.default_rng(seed)
+        lists = max(1, min(len(jobs), lists or round(math.sqrt(len(jobs)))))
+
+        sample = vectors
+        if len(vectors) > KMEANS_SAMPLE_SIZE:
+            sample = vectors[rng.choice(len(vectors), KMEANS_SAMPLE_SIZE, replace=False)]
+        centroids = _spherical_kmeans(sample, lists, KMEANS_ITERATIONS, rng)
+
+        assignment = _nearest_centroids(vectors, centroids)
+        ids = np.argsort(assignment, kind="stable").astype(np.int32)
+        offsets = np.zeros(lists + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(assignment, minlength=lists))
+        return cls(centroids, vectors[ids].astype(np.float16), offsets, ids, list(jobs))
+
+    def search(self, query: "np.ndarray", k: int = 10,
+               nprobe: int = DEFAULT_NPROBE) -> list[tuple[int, float]]:
+        """
+        Approximate top-k jobs by cosine similarity
+
+        Returns:
+            (job position, similarity) pairs, most similar first
+        """
+        import numpy as np
+
+        nprobe = min(nprobe, len(self.centroids))
+        probe = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        rows = np.concatenate([np.arange(self.offsets[i], self.offsets[i + 1]) for i in probe])
+        if not len(rows):
+            return []
+        scores = self.vectors[rows].astype(np.float32) @ query
+        return self._top_k(rows, scores, k)
+
+    def search_exact(self, query: "np.ndarray", k: int = 10) -> list[tuple[int, float]]:
+        """Brute-force top-k, the reference for measuring recall"""
+        import numpy as np
+
+        scores = self.vectors.astype(np.float32) @ query
+        return self._top_k(np.arange(len(scores)), scores, k)
+
+    def _top_k(self, rows, scores, k: int) -> list[tuple[int, float]]:
+        import numpy as np
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self.ids[rows[i]]), float(scores[i])) for i in top]
+
+    def save(self, path: str) -> None:
+        """Write the index and its jobs to one .npz file (atomically)"""
+        import numpy as np
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        jobs_json = np.frombuffer(json.dumps(self.jobs, ensure_ascii=False).encode(), dtype=np.uint8)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, centroids=self.centroids, vectors=self.vectors, offsets=self.offsets,
+                     ids=self.ids, jobs_json=jobs_json)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "JobVectorIndex":
+        import numpy as np
+
+        with np.load(path, allow_pickle=False) as data:
+            jobs = json.loads(data['jobs_json'].tobytes().decode())
+            return cls(data['centroids'], data['vectors'], data['offsets'], data['ids'], jobs)
+
+
+def job_index_path() -> str:
+    return os.getenv("STUDENT360_JOB_INDEX") or DEFAULT_INDEX_PATH
+
+
+@functools.lru_cache(maxsize=1)
+def _load_cached(path: str, mtime: float) -> JobVectorIndex:
+    return JobVectorIndex.load(path)
+
+
+def load_job_index() -> JobVectorIndex | None:
+    """The index at $STUDENT360_JOB_INDEX, reloaded when the file changes"""
+    path = job_index_path()
+    try:
+        return _load_cached(path, os.path.getmtime(path))
+    except FileNotFoundError:
+        return None
+
+
+def build_job_index(jobs: list[dict], path: str | None = None) -> JobVectorIndex:
+    """Build an index over jobs and save it (default: $STUDENT360_JOB_INDEX)"""
+    index = JobVectorIndex.build(jobs)
+    index.save(path or job_index_path())
+    return index
+
+
+def search_similar_jobs(user_profile: dict, top_k: int = 10) -> dict:
+    """Blocking implementation of find_similar_jobs; loads the index on first use"""
+    import numpy as np
+
+    index = load_job_index()
+    if index is None or not len(index):
+        return {'jobs': [], 'index_size': 0, 'reason': 'No local job index available'}
+
+    query = dense_vectors([profile_text(user_profile)])[0]
+    if not np.any(query):
+        return {'jobs': [], 'index_size': len(index), 'reason': 'Profile has no skills or roles'}
+
+    jobs = []
+    for position, similarity in index.search(query, top_k):
+        job = dict(index.jobs[position])
+        job['similarity'] = round(max(0.0, similarity), 3)
+        jobs.append(job)
+    return {'jobs': jobs, 'index_size': len(index)}
+
+
+async def find_similar_jobs(user_profile: dict, top_k: int = 10) -> dict:
+    """
+    Retrieve the jobs most similar to a profile from the local job index
+
+    Matching is semantic: related skills and roles count ("Spring Boot" is
+    close to "Java backend") even without a common keyword. Use it to add
+    candidates from earlier collected postings to a live search.
+
+    Args:
+        user_profile: User profile with skills and preferences
+        top_k: Number of jobs to return
+
+    Returns:
+        dict with 'jobs' (job dictionaries with a 'similarity' in [0, 1]) and
+        'index_size'; 'reason' explains an empty result
+    """
+    # Loading the index reads it from disk, and searching it is CPU-bound:
+    # keep both off the event loop
+    return await asyncio.to_thread(search_similar_jobs, user_profile, top_k)
@@ -0,0 +1,139 @@
+# -------- Session Result Cache --------
+# The scored job set and extracted requirements of the last search are kept
+# in ADK session state so follow-up refinements ("chỉ ở Hà Nội thôi", "show
+# more", "only junior") are answered locally instead of searching again.
+
+from typing import TYPE_CHECKING
+import json
+
+from student360_agent.tools.gazetteer import fold_text, province_gazetteer
+
+if TYPE_CHECKING:
+    from google.adk.tools import ToolContext
+
+RESULTS_STATE_KEY = "career_last_results"
+REQUIREMENTS_STATE_KEY = "career_last_requirements"
+
+# Bounds on what a search may leave in session state
+MAX_CACHED_JOBS = 100
+MAX_CACHED_BYTES = 64 * 1024
+MAX_FIELD_CHARS = 160
+MAX_CACHED_REASONS = 4
+
+EXPERIENCE_TERMS = {
+    'intern': ['intern', 'thực tập', 'trainee', 'fresher'],
+    'junior': ['junior', 'fresher', 'mới ra trường'],
+    'senior': ['senior', 'lead', 'principal', 'trưởng nhóm'],
+}
+
+
+def _compact(item: dict) -> dict:
+    job = item.get('job', {})
+    compact = {
+        field: str(job.get(field) or '')[:MAX_FIELD_CHARS]
+        for field in ('title', 'company', 'location', 'salary', 'url', 'source')
+    }
+    compact['score'] = item.get('score', 0)
+    compact['match_percentage'] = item.get('match_percentage', 0)
+    compact['reasons'] = list(item.get('reasons', []))[:MAX_CACHED_REASONS]
+    return compact
+
+
+def _expand(compact: dict) -> dict:
+    job = {key: value for key, value in compact.items()
+           if key not in ('score', 'match_percentage', 'reasons')}
+    return {
+        'job': job,
+        'score': compact['score'],
+        'reasons': compact['reasons'],
+        'match_percentage': compact['match_percentage'],
+    }
+
+
+def store_search_results(tool_context: "ToolContext | None", scored_jobs: list[dict]) -> None:
+    """Keep a compact, size-bounded copy of the ranked jobs in session state"""
+    if tool_context is None:
+        return
+
+    jobs = [_compact(item) for item in scored_jobs[:MAX_CACHED_JOBS]]
+    # Drop the lowest-ranked jobs until the entry fits the byte budget
+    while jobs and len(json.dumps(jobs, ensure_ascii=False).encode()) > MAX_CACHED_BYTES:
+        jobs = jobs[:len(jobs) * 3 // 4]
+    tool_context.state[RESULTS_STATE_KEY] = jobs
+
+
+def store_requirements(tool_context: "ToolContext | None", requirements: dict) -> None:
+    """Keep the extracted requirements of the current search in session state"""
+    if tool_context is not None:
+        tool_context.state[REQUIREMENTS_STATE_KEY] = requirements
+
+
+def refine_job_results(location: str = "", experience_level: str = "", keywords: str = "",
+                       page: int = 1, page_size: int = 5,
+                       tool_context: "ToolContext | None" = None) -> dict:
+    """
+    Refine the results of the previous job search without searching again
+
+    Use for follow-ups such as "chỉ ở Hà Nội thôi", "only junior" or "show
+    more". When 'needs_new_search' is true the cached results cannot satisfy
+    the refinement and a new search is required.
+
+    Args:
+        location: Keep only jobs in this location (e.g., "Hà Nội")
+        experience_level: Keep only "intern", "junior" or "senior" jobs
+        keywords: Space separated words that must appear in title or company
+        page: Page of results to return, starting at 1 ("show more" = next page)
+        page_size: Number of jobs per page
+
+    Returns:
+        dict with 'scored_jobs' (same shape as analyze_and_score_jobs, ready
+        for format_job_results), 'total_matches', 'page', 'total_pages',
+        'requirements' of the previous search and 'needs_new_search'
+    """
+    state = tool_context.state if tool_context is not None else {}
+    cached = state.get(RESULTS_STATE_KEY)
+    requirements = state.get(REQUIREMENTS_STATE_KEY) or {}
+    if not cached:
+        return {'scored_jobs': [], 'needs_new_search': True,
+                'reason': 'No previous search results in this session'}
+
+    # Compare provinces when the location is known ("HCM" == "Sài Gòn"),
+    # otherwise fall back to a folded substring match
+    provinces = province_gazetteer().values(location)
+    location_key = fold_text(location.strip())
+    level_terms = [fold_text(term) for term in EXPERIENCE_TERMS.get(experience_level.lower(), [])]
+    keyword_terms = [fold_text(term) for term in keywords.split() if term]
+
+    matches = []
+    for job in cached:
+        title = fold_text(job['title'])
+        if provinces:
+            if not set(provinces) & set(province_gazetteer().values(job['location'])):
+                continue
+        elif location_key and location_key not in fold_text(job['location']):
+            continue
+        if level_terms and not any(term in title for term in level_terms):
+            continue
+        haystack = title + " " + fold_text(job['company'])
+        if not all(term in haystack for term in keyword_terms):
+            continue
+        matches.append(job)
+
+    page_size = max(1, page_size)
+    page = max(1, page)
+    total_pages = (len(matches) + page_size - 1) // page_size
+    page_jobs = matches[(page - 1) * page_size:page * page_size]
+
+    result = {
+        'scored_jobs': [_expand(job) for job in page_jobs],
+        'total_matches': len(matches),
+        'page': page,
+        'total_pages': total_pages,
+        'requirements': requirements,
+        'needs_new_search': not page_jobs,
+    }
+    if not matches:
+        result['reason'] = 'No cached job matches this refinement'
+    elif not page_jobs:
+        result['reason'] = 'All cached results have already been shown'
+    return result
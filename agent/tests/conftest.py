@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make student360_agent importable when pytest is run from the agent directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,61 @@
+"""Gazetteer matching over folded text, and case-sensitive skill phrases."""
+
+import pytest
+
+from student360_agent.tools.gazetteer import (
+    Gazetteer, category_gazetteer, original_tokens, province_gazetteer, skill_gazetteer, tokenize)
+
+
+def test_matches_provinces_with_and_without_diacritics():
+    for text in ["Việc làm ở Hà Nội", "viec lam o ha noi", "HN"]:
+        assert province_gazetteer().values(text) == ["Hà Nội"]
+
+
+def test_matches_leftmost_longest_on_token_boundaries():
+    gazetteer = Gazetteer()
+    gazetteer.add("java", "java")
+    gazetteer.add("java ee", "jakarta ee")
+    gazetteer.add("script", "script")
+    assert gazetteer.values("Java EE and javascript") == ["jakarta ee"]
+
+
+def test_original_tokens_align_with_tokens():
+    for text in ["Có AI tuyển Node.js, C++ không?", "a_b .NET đ", "Sóc Trăng!", ""]:
+        assert len(original_tokens(text)) == len(tokenize(text))
+
+
+@pytest.mark.parametrize("text", [
+    "có ai tuyển intern không",
+    "Ai biết chỗ nào tuyển không",
+    "Việc làm Sóc Trăng",
+    "sắp tốt nghiệp",
+    "công ty cần thuê lập trình viên",
+    "có nhà cho thuê",
+    "less than 1 year experience",
+    "Less than 1 year experience",
+    "mùi hương",
+    "lúa gạo",
+])
+def test_common_vietnamese_and_english_words_are_not_skills(text):
+    assert skill_gazetteer().values(text) == []
+
+
+@pytest.mark.parametrize("text, skill", [
+    ("AI engineer", "artificial intelligence"),
+    ("trí tuệ nhân tạo", "artificial intelligence"),
+    ("SOC analyst", "soc"),
+    ("SAP consultant", "sap"),
+    ("Chuyên viên Thuế", "tax"),
+    ("kế toán thuế", "tax"),
+    ("LESS, SASS", "less"),
+    ("less css", "less"),
+    ("Lua scripting", "lua"),
+    ("MUI components", "material ui"),
+])
+def test_case_sensitive_phrases_match_the_original_text(text, skill):
+    assert skill in skill_gazetteer().values(text)
+
+
+def test_ambiguous_words_add_no_category():
+    assert category_gazetteer().values("có ai tuyển không, nhưng mà") == []
+    assert category_gazetteer().values("AI engineer, lập trình nhúng") == ["data_ai", "embedded_hardware"]
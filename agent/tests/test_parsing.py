@@ -0,0 +1,72 @@
+"""Job card detection: the job-item class token and ListingPageReader."""
+
+import pytest
+
+from student360_agent.tools.parsing import job_card_markers, parse_topcv_cards
+from student360_agent.tools.scraper import ListingPageReader
+
+
+def card(i: int, attrs: str) -> str:
+    return (f'<div {attrs}><h3 class="title"><a href="/viec-lam/job-{i}">Java Developer {i}</a></h3>'
+            f'<a class="company">Company {i}</a><label class="address">Hà Nội</label></div>')
+
+
+@pytest.mark.parametrize("attrs", [
+    'class="job-item"',
+    'class="job-item box"',
+    'class="bg-highlight job-item job-ta"',
+    "class='job-item'",
+    'data-cy="job-card"',
+])
+def test_parses_cards_by_class_token_or_data_cy(attrs):
+    html = "".join(card(i, attrs) for i in range(3)).encode()
+    jobs = parse_topcv_cards(html, "", 10)
+    assert [job['title'] for job in jobs] == [f"Java Developer {i}" for i in range(3)]
+    assert jobs[0]['url'] == "https://www.topcv.vn/viec-lam/job-0"
+
+
+def test_ignores_classes_that_only_contain_job_item():
+    html = "".join(card(i, 'class="job-item-search-result"') for i in range(3)).encode()
+    assert parse_topcv_cards(html, "", 10) == []
+
+
+@pytest.mark.parametrize("html, found", [
+    (b'<div class="job-item">', True),
+    (b'<div class="box job-item">', True),
+    (b'<div class="job-item-search-result">', False),
+    (b'<div class="my-job-item">', False),
+])
+def test_class_marker_matches_whole_token(html, found):
+    assert bool(job_card_markers()['class'].search(html)) is found
+
+
+def test_reader_stops_after_the_wanted_cards():
+    page = "".join(card(i, 'class="job-item"') for i in range(20)).encode()
+    reader = ListingPageReader(max_jobs=5)
+    chunks = [page[i:i + 100] for i in range(0, len(page), 100)]
+    fed = 0
+    for chunk in chunks:
+        fed += 1
+        if reader.feed(chunk):
+            break
+    assert fed < len(chunks)
+    # The last wanted card is complete
+    assert len(parse_topcv_cards(bytes(reader.body), "", 5)) == 5
+
+
+def test_reader_does_not_count_lookalike_classes():
+    page = "".join(card(i, 'class="job-item-search-result"') for i in range(20)).encode()
+    reader = ListingPageReader(max_jobs=5)
+    assert not any(reader.feed(page[i:i + 100]) for i in range(0, len(page), 100))
+
+
+def test_reader_counts_a_card_with_both_markers_once():
+    page = "".join(card(i, 'class="job-item" data-cy="job-card"') for i in range(5)).encode()
+    reader = ListingPageReader(max_jobs=5)
+    assert not reader.feed(page)
+
+
+def test_reader_truncates_at_max_bytes():
+    reader = ListingPageReader(max_jobs=5, max_bytes=1000)
+    assert reader.feed(b"x" * 1500)
+    assert len(reader.body) == 1000
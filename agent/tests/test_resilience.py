@@ -0,0 +1,180 @@
+"""Circuit breaker transitions and how async calls feed them."""
+
+import asyncio
+
+import pytest
+
+from student360_agent.tools import resilience
+from student360_agent.tools.resilience import (
+    CircuitBreaker, CircuitOpenError, Deadline, async_call_with_resilience, get_breaker)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(resilience.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers(monkeypatch):
+    monkeypatch.setattr(resilience, "_breakers", {})
+
+
+class HTTPError(Exception):
+    """Stands in for httpx.HTTPStatusError: carries a response with a status"""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.response = type("Response", (), {"status_code": status_code})()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("site", failure_threshold=3)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker("site", failure_threshold=3)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_slow_success_counts_as_failure(clock):
+    breaker = CircuitBreaker("site", failure_threshold=1, slow_call_seconds=2.0)
+    breaker.record_success(5.0)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_half_open_lets_one_probe_through(clock):
+    breaker = CircuitBreaker("site", failure_threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+    clock.now += 29
+    assert not breaker.allow_request()
+    clock.now += 2
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+
+def test_probe_success_closes_and_failure_reopens(clock):
+    breaker = CircuitBreaker("site", failure_threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+    clock.now += 31
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now += 31
+    assert breaker.allow_request()
+    breaker.record_success(0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_release_probe_allows_another_probe(clock):
+    breaker = CircuitBreaker("site", failure_threshold=1, reset_timeout=30.0)
+    breaker.record_failure()
+    clock.now += 31
+    assert breaker.allow_request()
+    breaker.release_probe()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+
+
+@pytest.mark.parametrize("status, upstream_failure", [
+    (404, False), (403, False), (429, True), (500, True), (503, True),
+])
+def test_is_upstream_failure(status, upstream_failure):
+    assert resilience.is_upstream_failure(HTTPError(status)) is upstream_failure
+
+
+def test_transport_errors_are_upstream_failures():
+    assert resilience.is_upstream_failure(ConnectionError("reset"))
+
+
+def test_client_errors_do_not_open_the_circuit():
+    async def not_found(timeout: float):
+        raise HTTPError(404)
+
+    async def run():
+        for _ in range(5):
+            with pytest.raises(HTTPError):
+                await async_call_with_resilience("topcv", not_found, Deadline(5))
+
+    asyncio.run(run())
+    assert get_breaker("topcv").state == CircuitBreaker.CLOSED
+
+
+def test_server_errors_open_the_circuit():
+    calls = []
+
+    async def unavailable(timeout: float):
+        calls.append(timeout)
+        raise HTTPError(503)
+
+    async def run():
+        for _ in range(3):
+            with pytest.raises(HTTPError):
+                await async_call_with_resilience("topcv", unavailable, Deadline(5), attempts=1)
+        with pytest.raises(CircuitOpenError):
+            await async_call_with_resilience("topcv", unavailable, Deadline(5), attempts=1)
+
+    asyncio.run(run())
+    assert len(calls) == 3
+
+
+def test_cancelled_calls_are_not_failures():
+    async def hang(timeout: float):
+        await asyncio.sleep(60)
+
+    async def run():
+        for _ in range(5):
+            task = asyncio.create_task(async_call_with_resilience("topcv", hang, Deadline(60)))
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(run())
+    assert get_breaker("topcv").state == CircuitBreaker.CLOSED
+
+
+def test_cancelled_probe_releases_the_slot():
+    breaker = get_breaker("topcv")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    # Let the reset timeout pass without patching the event loop's clock
+    breaker._opened_at -= breaker.reset_timeout + 1
+
+    async def hang(timeout: float):
+        await asyncio.sleep(60)
+
+    async def run():
+        task = asyncio.create_task(async_call_with_resilience("topcv", hang, Deadline(60)))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
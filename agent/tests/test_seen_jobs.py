@@ -0,0 +1,61 @@
+"""Seen-job Bloom filters: fingerprints, generations and the file format."""
+
+import pytest
+
+from student360_agent.tools.seen_jobs import (
+    SEEN_CAPACITY, BloomFilter, SeenJobStore, UserSeenJobs, canonical_url, job_fingerprints)
+
+
+def job(i: int) -> dict:
+    return {'title': f"Java Developer {i}", 'company': "Công ty A",
+            'url': f"https://www.topcv.vn/viec-lam/java-{i}.html"}
+
+
+def test_same_posting_through_different_links_is_seen():
+    user = UserSeenJobs()
+    user.add(job_fingerprints(job(1)))
+    tracked = {**job(1), 'url': "http://topcv.vn/viec-lam/java-1.html/?utm_source=x&ta_source=y"}
+    assert user.seen(job_fingerprints(tracked))
+    # Found on Google under another URL: title + company still match
+    assert user.seen(job_fingerprints({**job(1), 'url': "https://google.com/x"}))
+    assert not user.seen(job_fingerprints(job(2)))
+
+
+def test_canonical_url_drops_tracking_params():
+    assert (canonical_url("http://www.topcv.vn/a/?utm_medium=m&id=3&gclid=1")
+            == canonical_url("https://topcv.vn/a?id=3"))
+
+
+def test_generation_holds_seen_capacity_jobs():
+    user = UserSeenJobs()
+    for i in range(SEEN_CAPACITY - 100):
+        user.add(job_fingerprints(job(i)))
+    assert user.previous is None
+    for i in range(SEEN_CAPACITY - 100, SEEN_CAPACITY + 100):
+        user.add(job_fingerprints(job(i)))
+    assert user.previous is not None
+    assert user.seen(job_fingerprints(job(0)))
+
+
+def test_file_format_round_trip():
+    user = UserSeenJobs(BloomFilter(capacity=100))
+    for i in range(60):
+        user.add(job_fingerprints(job(i)))
+    loaded = UserSeenJobs.from_bytes(user.to_bytes())
+    assert loaded.current.bits == user.current.bits
+    assert loaded.current.count == user.current.count
+    assert loaded.previous.bits == user.previous.bits
+    assert all(loaded.seen(job_fingerprints(job(i))) for i in range(60))
+
+
+@pytest.mark.parametrize("data", [b"not a seen-jobs file", UserSeenJobs().to_bytes()[:-10]])
+def test_rejects_corrupt_files(data):
+    with pytest.raises(ValueError):
+        UserSeenJobs.from_bytes(data)
+
+
+def test_store_persists_between_instances(tmp_path):
+    SeenJobStore(str(tmp_path)).mark_seen("user-1", [job(1)])
+    store = SeenJobStore(str(tmp_path))
+    assert store.seen_flags("user-1", [job(1), job(2)]) == [True, False]
+    assert store.seen_flags("user-2", [job(1)]) == [False]
@@ -0,0 +1,58 @@
+"""Refining the previous search from session state."""
+
+from types import SimpleNamespace
+
+from student360_agent.tools.session_cache import refine_job_results, store_search_results
+
+
+def scored(title: str, location: str, score: int) -> dict:
+    return {'job': {'title': title, 'company': "Công ty A", 'location': location,
+                    'url': f"https://www.topcv.vn/viec-lam/{score}"},
+            'score': score, 'reasons': [], 'match_percentage': score * 4}
+
+
+def context_with_results() -> SimpleNamespace:
+    context = SimpleNamespace(state={})
+    store_search_results(context, [
+        scored("Senior Java Developer", "Hồ Chí Minh", 12),
+        scored("Junior Java Developer", "Hà Nội", 10),
+        scored("Thực tập sinh Java", "Ha Noi", 8),
+        scored("Java Intern", "Đà Nẵng", 6),
+    ])
+    return context
+
+
+def titles(result: dict) -> list[str]:
+    return [item['job']['title'] for item in result['scored_jobs']]
+
+
+def test_without_previous_results_a_new_search_is_needed():
+    result = refine_job_results(location="Hà Nội", tool_context=SimpleNamespace(state={}))
+    assert result['needs_new_search']
+
+
+def test_filters_by_province_alias():
+    result = refine_job_results(location="HN", tool_context=context_with_results())
+    assert titles(result) == ["Junior Java Developer", "Thực tập sinh Java"]
+    assert not result['needs_new_search']
+
+
+def test_filters_by_level_with_folded_terms():
+    result = refine_job_results(experience_level="intern", tool_context=context_with_results())
+    assert titles(result) == ["Thực tập sinh Java", "Java Intern"]
+
+
+def test_pages_through_results():
+    context = context_with_results()
+    first = refine_job_results(page_size=3, tool_context=context)
+    second = refine_job_results(page=2, page_size=3, tool_context=context)
+    third = refine_job_results(page=3, page_size=3, tool_context=context)
+    assert first['total_pages'] == 2
+    assert titles(second) == ["Java Intern"]
+    assert third['needs_new_search']
+
+
+def test_no_match_asks_for_a_new_search():
+    result = refine_job_results(keywords="python", tool_context=context_with_results())
+    assert result['needs_new_search']
+    assert result['total_matches'] == 0